@@ -2,75 +2,409 @@
 API Routes for Shark Foraging Hotspot Prediction
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
-from datetime import datetime, date
-from typing import Optional, Dict, Any
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, Request
+from fastapi.responses import ORJSONResponse, Response
+from datetime import datetime, date, timedelta
+from typing import Optional, Dict, Any, Tuple, NamedTuple, Literal
+import asyncio
 import logging
 import json
+import gzip
+import hashlib
+import time
+from collections import OrderedDict
+import orjson
 import numpy as np
 import xarray as xr
 
 from models.hsi_model import HSIModel
 from data.nasa_data import NASADataManager
 from data.gfw_data import GFWDataManager
-from utils.geojson_converter import convert_dataset_to_geojson, convert_hsi_to_geojson_cached, convert_dataset_to_geojson_cached
+from utils.geojson_converter import convert_dataset_to_geojson, convert_dataset_to_flat, convert_hsi_to_geojson_encoded, convert_dataset_to_geojson_cached
 from utils.geojson_cache import get_geojson_cache
 from utils.cache_cleanup import run_maintenance_cleanup, cleanup_expired_cache, cleanup_old_cache_by_date, cleanup_cache_by_size
+from utils.response_cache import get_response_cache
+from utils.executors import run_io, run_compute
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+def _orjson_default(obj: Any) -> Any:
+    """Encode values orjson does not handle natively (NumPy datetimes, pandas timestamps)"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _encode_json(content: Any) -> bytes:
+    """Encode content with orjson, including NumPy arrays/scalars and non-string keys"""
+    return orjson.dumps(
+        content,
+        default=_orjson_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+class NumpyORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes NumPy arrays/scalars and non-string keys"""
+
+    def render(self, content: Any) -> bytes:
+        return _encode_json(content)
+
+router = APIRouter(default_response_class=NumpyORJSONResponse)
 
 # Initialize models
 hsi_model = HSIModel()
 nasa_manager = NASADataManager()
 gfw_manager = GFWDataManager()
 
-# Global cache for shared data between HSI and overlays
-_data_cache = {}
-
-def _clean_response_data(data):
-    """Clean response data to remove NaN values for JSON serialization"""
-    if isinstance(data, dict):
-        return {k: _clean_response_data(v) for k, v in data.items()}
-    elif isinstance(data, list):
-        return [_clean_response_data(item) for item in data]
-    elif isinstance(data, float) and np.isnan(data):
-        return 0.0
-    elif isinstance(data, np.floating) and np.isnan(data):
-        return 0.0
+# Species model parameters are fixed at startup, so build the metadata dicts once
+_PROFILE_PARAMS = {
+    species: dict(profile.__dict__)
+    for species, profile in hsi_model.shark_profiles.items()
+}
+
+# Pre-encoded /species body (profiles do not change while the server runs)
+_SPECIES_BODY = orjson.dumps(
+    hsi_model.get_shark_profiles(),
+    default=_orjson_default,
+    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+)
+
+# Pre-encoded /datasets body (dataset configuration is fixed at startup)
+_DATASETS_BODY = orjson.dumps(nasa_manager.get_dataset_info())
+
+# /health body template; only the timestamp changes between requests
+_HEALTH_TEMPLATE = b'{"status":"healthy","timestamp":"%s"}'
+
+# GFW attribution text is constant for the lifetime of the process
+_GFW_ATTRIBUTION = gfw_manager.get_data_attribution()
+
+# Short-lived cache of loaded NASA datasets keyed on (dataset, date), shared across
+# species and requests (cache-aside in front of NASADataManager.download_data).
+# Bounded LRU - each entry holds a full global grid.
+_DATA_CACHE_TTL_SECONDS = 300
+_DATA_CACHE_MAX_ENTRIES = 32
+_data_cache = OrderedDict()
+_data_cache_stats = {'hits': 0, 'misses': 0}
+
+# Static model documentation included in every GeoJSON hotspots response. Built once at
+# import and referenced by the response (plain dicts - orjson does not serialize mappingproxy).
+_STATIC_HOTSPOTS_METADATA = {
+    "data_limitations": {
+        "sea_level_coverage": "Enhanced coverage using combined ascending and descending passes, with fallback to gridded data",
+        "missing_data_handling": "NASA-SSH built-in temporal merging within 10-day observation window, dual-pass geometry for improved spatial coverage",
+        "temporal_merge": "NASA-SSH uses 10-day observations per grid with Gaussian weighted spatial averaging",
+        "pass_combination": "Ascending and descending passes combined using xarray.concat for enhanced western hemisphere coverage"
+    },
+    "oceanographic_features": {
+        "eddy_detection": {
+            "method": "Gaussian normalization of Sea Level Anomaly (SLA)",
+            "formula": "f_eddy = exp(-E'²/(2σ²)) where σ = 0.1m",
+            "types": {
+                "cyclonic_eddies": "Negative SLA, cold-core, upwelling, nutrient-rich",
+                "anticyclonic_eddies": "Positive SLA, warm-core, downwelling, prey concentration"
+            },
+            "optimal_strength": "Moderate SLA values (±0.1m) provide highest shark foraging suitability",
+            "size_range": "50-300 km diameter, captured by 0.5° grid resolution"
+        },
+        "front_detection": {
+            "method": "Spatial gradient analysis of SLA",
+            "formula": "|∇SLA| = √((∂SLA/∂lat)² + (∂SLA/∂lon)²)",
+            "suitability": "f_front = exp(-|∇SLA|/σ_front) where σ_front = 0.05 m/degree",
+            "characteristics": "Sharp boundaries between water masses, convergence zones where prey concentrates",
+            "additional_fronts": "Thermal fronts detected through Sea Surface Temperature gradients"
+        },
+        "combined_suitability": {
+            "formula": "f_E = 0.6 × f_eddy + 0.4 × f_front",
+            "weighting": {
+                "eddies": "60% - Primary foraging hotspots",
+                "fronts": "40% - Secondary but important prey concentration zones"
+            },
+            "ecological_significance": "Both features drive prey aggregation through upwelling, convergence, and nutrient cycling"
+        }
+    },
+    "nasa_challenge": {
+        "challenge_name": "Sharks from Space",
+        "challenge_year": "2025",
+        "challenge_url": "https://www.spaceappschallenge.org/2025/challenges/sharks-from-space/",
+        "nasa_mission": "Earth Science Division",
+        "data_sources": "NASA Earthdata Cloud",
+        "project_alignment": "Satellite-based shark habitat prediction using NASA oceanographic data"
+    },
+    "nasa_ssh_enhancements": {
+        "user_guide_compliance": "Full implementation of NASA-SSH User Guide specifications",
+        "quality_control": "Comprehensive flag handling (nasa_flag, median_filter_flag, source_flag)",
+        "orbit_error_reduction": "OER correction applied for improved data quality",
+        "basin_aware_processing": "Ocean basin connectivity rules implemented",
+        "crossover_analysis": "Pass-to-pass validation for data quality assessment",
+        "dual_pass_geometry": "Combined ascending and descending passes for enhanced spatial coverage",
+        "basin_connectivity": "266 ocean basins with connectivity rules for geographically correlated regions",
+        "dtu21_reference": "DTU21 Mean Sea Surface (1993-2012) reference information",
+        "along_track_support": "High-resolution along-track data processing available",
+        "oceanographic_features": "Enhanced eddy and front detection using NASA-SSH specifications"
+    }
+}
+
+# Pre-encoded copy for /hotspots/metadata-static (content never changes while the server runs)
+_STATIC_HOTSPOTS_METADATA_BODY = orjson.dumps(_STATIC_HOTSPOTS_METADATA)
+_STATIC_HOTSPOTS_METADATA_ETAG = f'"{hashlib.blake2b(_STATIC_HOTSPOTS_METADATA_BODY, digest_size=16).hexdigest()}"'
+
+# The same members without the enclosing braces, spliced after the per-request metadata
+# in GeoJSON hotspots responses (top-level keys do not overlap _build_base_metadata)
+_STATIC_HOTSPOTS_METADATA_MEMBERS = _STATIC_HOTSPOTS_METADATA_BODY[1:-1]
+
+# Request-independent part of the /combined-pass-data metadata
+_COMBINED_PASS_STATIC_METADATA = {
+    "data_type": "combined_pass",
+    "data_source": "NASA-SSH Combined Pass Data V1",
+    "resolution": "once-per-second sampling, 5-10 km diameter",
+    "processing": "19-point Gaussian-like normalized filter",
+    "quality_control": "Comprehensive flag handling and orbit error reduction",
+    "reference_surface": "DTU21 Mean Sea Surface (1993-2012)",
+    "satellite_missions": "TOPEX/Poseidon, Jason-1, Jason-2, Jason-3, Sentinel-6",
+    "coverage_enhancement": "Dual pass geometry for improved spatial coverage",
+    "combined_pass_features": {
+        "dual_geometry": "Ascending and descending passes combined for complete coverage",
+        "western_hemisphere": "Enhanced coverage in western hemisphere through dual pass geometry",
+        "spatial_resolution": "Improved spatial sampling through multiple viewing angles",
+        "data_quality": "Cross-validation between ascending and descending measurements"
+    }
+}
+
+# Pre-encoded opening of the combined-pass metadata object: '{' plus the static members
+# and a trailing ',' so only the per-request members are encoded for each response
+_COMBINED_PASS_METADATA_PREFIX = orjson.dumps(_COMBINED_PASS_STATIC_METADATA)[:-1] + b','
+
+# Downloads currently in progress, keyed on (dataset, date). Concurrent requests (and
+# prefetches) for the same granule await one shared download instead of each fetching it.
+_inflight_downloads: Dict[Tuple[str, str], asyncio.Future] = {}
+
+async def _download_dataset(dataset: str, target_date: str) -> Optional[xr.Dataset]:
+    """Download a NASA dataset, coalescing concurrent calls for the same dataset and date"""
+    download_key = (dataset, target_date)
+    download = _inflight_downloads.get(download_key)
+    if download is None:
+        download = asyncio.ensure_future(run_io(nasa_manager.download_data, dataset, target_date))
+        _inflight_downloads[download_key] = download
+        download.add_done_callback(lambda _: _inflight_downloads.pop(download_key, None))
     else:
-        return data
+        logger.info("Joining in-flight %s download for %s", dataset, target_date)
+    
+    # Shield so a cancelled caller does not cancel the download shared with other callers
+    return await asyncio.shield(download)
+
+# Neighbouring-date prefetch (users typically step through consecutive dates)
+_PREFETCH_DATASETS = ('sea_level', 'chlorophyll', 'sst')
+_prefetch_semaphore = asyncio.Semaphore(2)  # Keep prefetching from starving live requests
+
+async def _prefetch_adjacent_dates(target_day: date, shark_species: str):
+    """Warm the NASA data cache for the days before and after the requested date"""
+    today = date.today()
+    for neighbour in (target_day + timedelta(days=1), target_day - timedelta(days=1)):
+        # Future dates have no data yet
+        if neighbour > today:
+            continue
+        
+        neighbour_date = neighbour.isoformat()
+        lagged_dates = hsi_model.calculate_lagged_dates(neighbour, shark_species)
+        dataset_dates = {
+            'sea_level': neighbour_date,
+            'chlorophyll': lagged_dates['chlorophyll_lag_date'],
+            'sst': lagged_dates['temperature_lag_date']
+        }
+        
+        for dataset in _PREFETCH_DATASETS:
+            prefetch_key = (dataset, dataset_dates[dataset])
+            # Already in memory or being downloaded (by a request or another prefetch)
+            if prefetch_key in _data_cache or prefetch_key in _inflight_downloads:
+                continue
+            # Already on disk: nothing to fetch
+            if await run_io(nasa_manager.is_cached, *prefetch_key):
+                continue
+            try:
+                # Through _load_dataset so the downloaded data also lands in _data_cache
+                async with _prefetch_semaphore:
+                    await _load_dataset(*prefetch_key)
+            except Exception as e:
+                logger.warning("Prefetch of %s for %s failed: %s", dataset, dataset_dates[dataset], e)
+
+# Datasets required by the HSI model: name -> (label for error messages, required variable)
+_REQUIRED_VARS = {
+    'sst': ('SST', 'sst'),
+    'chlorophyll': ('Chlorophyll', 'chlorophyll'),
+    'sea_level': ('Sea level', 'sea_level'),
+    'salinity': ('Salinity', 'salinity')
+}
+
+def _has_var(dataset: Optional[xr.Dataset], variable: str) -> bool:
+    """Check that a dataset is present and contains the given variable"""
+    try:
+        return variable in dataset.data_vars
+    except AttributeError:
+        return False
 
-def _cache_data(target_date: str, bounds: Optional[Dict], datasets: Dict):
-    """Cache datasets for reuse by overlay endpoints"""
-    cache_key = f"{target_date}_{hash(str(bounds)) if bounds else 'global'}"
-    _data_cache[cache_key] = {
-        'datasets': datasets,
-        'timestamp': datetime.now()
+def _cache_data(dataset: str, target_date: str, data: xr.Dataset):
+    """Cache a loaded dataset for reuse by later requests"""
+    now = time.monotonic()
+    
+    # Drop expired entries so stale datasets are released even if never requested again
+    expired_keys = [key for key, cached in _data_cache.items() if now - cached['timestamp'] >= _DATA_CACHE_TTL_SECONDS]
+    for key in expired_keys:
+        del _data_cache[key]
+    
+    _data_cache[(dataset, target_date)] = {
+        'data': data,
+        'timestamp': now
     }
-    logger.info(f"Cached datasets for {target_date} for overlay reuse")
+    _data_cache.move_to_end((dataset, target_date))
+    
+    # Evict least recently used datasets beyond the size limit
+    while len(_data_cache) > _DATA_CACHE_MAX_ENTRIES:
+        _data_cache.popitem(last=False)
+    
+    logger.debug("Cached %s dataset for %s", dataset, target_date)
 
-def _get_cached_data(target_date: str, bounds: Optional[Dict]) -> Optional[Dict]:
-    """Get cached datasets if available and recent"""
-    cache_key = f"{target_date}_{hash(str(bounds)) if bounds else 'global'}"
+def _get_cached_data(dataset: str, target_date: str) -> Optional[xr.Dataset]:
+    """Get a cached dataset if available and recent"""
+    cache_key = (dataset, target_date)
     
-    if cache_key in _data_cache:
-        cached = _data_cache[cache_key]
-        # Cache valid for 5 minutes
-        if (datetime.now() - cached['timestamp']).seconds < 300:
-            logger.info(f"Using cached datasets for {target_date}")
-            return cached['datasets']
+    cached = _data_cache.get(cache_key)
+    if cached is not None:
+        if time.monotonic() - cached['timestamp'] < _DATA_CACHE_TTL_SECONDS:
+            _data_cache.move_to_end(cache_key)
+            _data_cache_stats['hits'] += 1
+            logger.debug("Using cached %s dataset for %s", dataset, target_date)
+            return cached['data']
         else:
             # Remove expired cache
             del _data_cache[cache_key]
     
+    _data_cache_stats['misses'] += 1
     return None
 
+async def _load_dataset(dataset: str, target_date: str) -> Optional[xr.Dataset]:
+    """Load a NASA dataset, checking the in-process cache before downloading"""
+    data = _get_cached_data(dataset, target_date)
+    if data is not None:
+        return data
+    
+    data = await _download_dataset(dataset, target_date)
+    if data is not None:
+        _cache_data(dataset, target_date, data)
+    return data
+
+def _build_base_metadata(shark_species: str,
+                         target_date: str,
+                         stats: Dict[str, Any],
+                         lagged_dates: Dict[str, str],
+                         lagged_chlorophyll_available: bool,
+                         lagged_sst_available: bool,
+                         gfw_data_available: Dict[str, bool]) -> Dict[str, Any]:
+    """Build the per-request hotspots metadata shared by the geojson and raw formats"""
+    return {
+        "shark_species": shark_species,
+        "target_date": target_date,
+        "statistics": stats,
+        "model_parameters": _PROFILE_PARAMS[shark_species],
+        "data_source": "NASA-SSH L4",
+        "lagged_dates": lagged_dates,
+        "lagged_data_available": {
+            "chlorophyll": lagged_chlorophyll_available,
+            "temperature": lagged_sst_available
+        },
+        "anthropogenic_data_available": gfw_data_available,
+        "anthropogenic_data_source": _GFW_ATTRIBUTION,
+        "processing_area": "Global"
+    }
+
+def _response_ttl(target_date: str) -> int:
+    """Get the response cache TTL for a date (past dates are immutable)"""
+    response_cache = get_response_cache()
+    if target_date < date.today().isoformat():
+        return response_cache.past_date_ttl_seconds
+    return response_cache.default_ttl_seconds
+
+# Bump when response content changes for the same request parameters,
+# so clients holding an ETag for a past date revalidate
+_RESPONSE_VERSION = "1"
+
+def _response_etag(cache_key: str) -> str:
+    """Build the ETag for an immutable (past-date) response from its request key"""
+    digest = hashlib.blake2b(f"{_RESPONSE_VERSION}|{cache_key}".encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def _conditional_headers(target_day: date, cache_key: str) -> Dict[str, str]:
+    """Get ETag/Cache-Control headers for past-date responses (empty for today's data)"""
+    if target_day >= date.today():
+        return {}
+    return {
+        "ETag": _response_etag(cache_key),
+        "Cache-Control": "public, max-age=31536000, immutable"
+    }
+
+def _etag_matches(request: Request, etag: Optional[str]) -> bool:
+    """Check an If-None-Match request header against an ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match or not etag:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+# Large cached bodies are gzip-compressed once when stored, instead of by the
+# GZip middleware on every request that hits the cache
+_PRECOMPRESS_MIN_BYTES = 64 * 1024
+_PRECOMPRESS_LEVEL = 6
+
+def _accepts_gzip(request: Request) -> bool:
+    """Check whether the client accepts gzip-encoded responses"""
+    return "gzip" in request.headers.get("accept-encoding", "")
+
+async def _stored_response(request: Request, cached: Tuple[bytes, str, Optional[str]], headers: Dict[str, str]) -> Response:
+    """Build a response from a response cache entry"""
+    body, media_type, content_encoding = cached
+    if content_encoding == "gzip":
+        if _accepts_gzip(request):
+            return Response(
+                content=body,
+                media_type=media_type,
+                headers={**headers, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+            )
+        body = await run_compute(gzip.decompress, body)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+async def _cache_response(request: Request,
+                          cache_key: str,
+                          response: Response,
+                          target_date: str,
+                          params: Dict[str, Any],
+                          headers: Dict[str, str],
+                          namespace: str = "hotspots") -> Response:
+    """Store an encoded response in the response cache and return it to the client"""
+    body = response.body
+    content_encoding = None
+    if len(body) >= _PRECOMPRESS_MIN_BYTES:
+        body = await run_compute(gzip.compress, body, compresslevel=_PRECOMPRESS_LEVEL)
+        content_encoding = "gzip"
+    
+    get_response_cache().set(
+        cache_key,
+        body,
+        response.media_type,
+        ttl_seconds=_response_ttl(target_date),
+        namespace=namespace,
+        params=params,
+        content_encoding=content_encoding
+    )
+    
+    if content_encoding is None or not _accepts_gzip(request):
+        return response
+    return await _stored_response(request, (body, response.media_type, content_encoding), headers)
+
 @router.get("/hotspots")
 async def get_hotspots(
-    target_date: str = Query(..., description="Target date in YYYY-MM-DD format"),
+    request: Request,
+    background_tasks: BackgroundTasks,
+    target_day: date = Query(..., alias="target_date", description="Target date in YYYY-MM-DD format"),
     shark_species: str = Query(..., description="Shark species: 'great_white', 'tiger_shark', or 'bull_shark'"),
     format: str = Query("geojson", description="Output format: 'geojson' or 'raw'"),
     threshold: float = Query(0.0, description="Minimum HSI threshold for inclusion (0.0-1.0, default 0.0 returns all grid points)")
@@ -87,11 +421,8 @@ async def get_hotspots(
         GeoJSON or raw HSI data
     """
     try:
-        # Validate inputs
-        try:
-            datetime.strptime(target_date, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        # Date format is validated by FastAPI; keep the canonical string for caching/downloads
+        target_date = target_day.isoformat()
         
         if shark_species not in hsi_model.shark_profiles:
             raise HTTPException(
@@ -99,31 +430,82 @@ async def get_hotspots(
                 detail=f"Invalid shark species. Available: {list(hsi_model.shark_profiles.keys())}"
             )
         
-        logger.info(f"Processing request for {shark_species} on {target_date} - calculating HSI for entire dataset")
+        # Serve identical requests straight from the response cache
+        response_cache = get_response_cache()
+        cache_params = {
+            "target_date": target_date,
+            "shark_species": shark_species,
+            "format": format.lower(),
+            "threshold": threshold
+        }
+        cache_key = response_cache.build_key("hotspots", **cache_params)
+        
+        # Past-date results are immutable: let clients revalidate with If-None-Match
+        # and answer with 304 before any cache lookup or serialization
+        conditional_headers = _conditional_headers(target_day, cache_key)
+        if _etag_matches(request, conditional_headers.get("ETag")):
+            return Response(status_code=304, headers=conditional_headers)
+        
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("Serving cached hotspots response for %s on %s", shark_species, target_date)
+            return await _stored_response(request, cached_response, conditional_headers)
+        
+        logger.info("Processing request for %s on %s - calculating HSI for entire dataset", shark_species, target_date)
+        
+        # Warm the NASA cache for adjacent dates once the response has been sent
+        # (only on a miss, so cached and 304 responses never trigger downloads)
+        background_tasks.add_task(_prefetch_adjacent_dates, target_day, shark_species)
         
         # Calculate lagged dates for trophic lag
-        lagged_dates = hsi_model.calculate_lagged_dates(target_date, shark_species)
-        logger.info(f"Lagged dates: {lagged_dates}")
+        lagged_dates = hsi_model.calculate_lagged_dates(target_day, shark_species)
+        logger.debug("Lagged dates: %s", lagged_dates)
+        
+        # Fail fast when no sea level granule exists within the download fallback window,
+        # before spending downloads and HSI computation on a date that cannot succeed
+        sea_level_coverage = await run_io(nasa_manager.has_sea_level_coverage, target_date)
+        if sea_level_coverage is False:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No sea level data available within {nasa_manager.sea_level_fallback_window_days} days of {target_date}"
+            )
         
         # Fetch datasets efficiently - only get lagged data for chlorophyll and SST
         datasets = {}
         lagged_chlorophyll_data = None
         lagged_sst_data = None
         
-        # Always fetch sea_level and salinity for current date (no lag)
+        # Download the four NASA datasets and the two GFW layers concurrently
+        # (sea_level and salinity always use the current date)
+        chlorophyll_lagged = lagged_dates['chlorophyll_lag_days'] > 0
+        sst_lagged = lagged_dates['temperature_lag_days'] > 0
+        (sea_level_result, salinity_result, chlorophyll_result, sst_result,
+         fishing_result, shipping_result) = await asyncio.gather(
+            _load_dataset('sea_level', target_date),
+            _load_dataset('salinity', target_date),
+            _load_dataset('chlorophyll',
+                          lagged_dates['chlorophyll_lag_date'] if chlorophyll_lagged else target_date),
+            _load_dataset('sst',
+                          lagged_dates['temperature_lag_date'] if sst_lagged else target_date),
+            run_io(gfw_manager.fetch_fishing_effort, target_date, target_date),
+            run_io(gfw_manager.fetch_vessel_density, target_date, target_date),
+            return_exceptions=True
+        )
+        
         try:
-            sea_level_data = nasa_manager.download_data('sea_level', target_date)
-            salinity_data = nasa_manager.download_data('salinity', target_date)
+            for result in (sea_level_result, salinity_result):
+                if isinstance(result, Exception):
+                    raise result
             
-            if sea_level_data is not None:
-                datasets['sea_level'] = sea_level_data
-                logger.info("Successfully retrieved sea level data")
+            if sea_level_result is not None:
+                datasets['sea_level'] = sea_level_result
+                logger.debug("Successfully retrieved sea level data")
             else:
                 raise ValueError("Failed to retrieve sea level data")
                 
-            if salinity_data is not None:
-                datasets['salinity'] = salinity_data
-                logger.info("Successfully retrieved salinity data")
+            if salinity_result is not None:
+                datasets['salinity'] = salinity_result
+                logger.debug("Successfully retrieved salinity data")
             else:
                 raise ValueError("Failed to retrieve salinity data")
                 
@@ -131,112 +513,95 @@ async def get_hotspots(
             logger.error(f"Failed to retrieve required datasets: {e}")
             raise HTTPException(status_code=404, detail=str(e))
         
-        # Fetch lagged chlorophyll data (preferred over current date)
+        # Resolve chlorophyll data (lagged preferred over current date)
         try:
-            if lagged_dates['chlorophyll_lag_days'] > 0:
-                lagged_chlorophyll_data = nasa_manager.download_data(
-                    'chlorophyll', lagged_dates['chlorophyll_lag_date']
-                )
+            if isinstance(chlorophyll_result, Exception):
+                raise chlorophyll_result
+            if chlorophyll_lagged:
+                lagged_chlorophyll_data = chlorophyll_result
                 if lagged_chlorophyll_data is not None:
                     datasets['chlorophyll'] = lagged_chlorophyll_data
-                    logger.info(f"Successfully retrieved lagged chlorophyll data from {lagged_dates['chlorophyll_lag_date']}")
+                    logger.debug("Successfully retrieved lagged chlorophyll data from %s", lagged_dates['chlorophyll_lag_date'])
                 else:
                     # Fallback to current date chlorophyll
                     logger.warning(f"Could not retrieve lagged chlorophyll data, trying current date")
-                    datasets['chlorophyll'] = nasa_manager.download_data('chlorophyll', target_date)
+                    datasets['chlorophyll'] = await _load_dataset('chlorophyll', target_date)
             else:
-                # No lag needed, fetch current date
-                datasets['chlorophyll'] = nasa_manager.download_data('chlorophyll', target_date)
+                # No lag needed, current date was fetched
+                datasets['chlorophyll'] = chlorophyll_result
         except Exception as e:
             logger.error(f"Failed to retrieve chlorophyll data: {e}")
             raise HTTPException(status_code=404, detail=f"Chlorophyll data retrieval failed: {e}")
         
-        # Fetch lagged SST data (preferred over current date)
+        # Resolve SST data (lagged preferred over current date)
         try:
-            if lagged_dates['temperature_lag_days'] > 0:
-                lagged_sst_data = nasa_manager.download_data(
-                    'sst', lagged_dates['temperature_lag_date']
-                )
+            if isinstance(sst_result, Exception):
+                raise sst_result
+            if sst_lagged:
+                lagged_sst_data = sst_result
                 if lagged_sst_data is not None:
                     datasets['sst'] = lagged_sst_data
-                    logger.info(f"Successfully retrieved lagged SST data from {lagged_dates['temperature_lag_date']}")
+                    logger.debug("Successfully retrieved lagged SST data from %s", lagged_dates['temperature_lag_date'])
                 else:
                     # Fallback to current date SST
                     logger.warning(f"Could not retrieve lagged SST data, trying current date")
-                    datasets['sst'] = nasa_manager.download_data('sst', target_date)
+                    datasets['sst'] = await _load_dataset('sst', target_date)
             else:
-                # No lag needed, fetch current date
-                datasets['sst'] = nasa_manager.download_data('sst', target_date)
+                # No lag needed, current date was fetched
+                datasets['sst'] = sst_result
         except Exception as e:
             logger.error(f"Failed to retrieve SST data: {e}")
             raise HTTPException(status_code=404, detail=f"SST data retrieval failed: {e}")
         
-        # Cache datasets for overlay reuse
-        _cache_data(target_date, None, datasets)
-        logger.info("All required datasets successfully retrieved with optimized lag-based fetching")
+        logger.debug("All required datasets successfully retrieved with optimized lag-based fetching")
         
-        # Fetch anthropogenic pressure data (GFW)
-        logger.info("--- Fetching Anthropogenic Pressure Data (GFW) ---")
+        # Resolve anthropogenic pressure data (GFW), fetched alongside the NASA data above
+        logger.debug("--- Resolving Anthropogenic Pressure Data (GFW) ---")
         fishing_pressure_data = None
         shipping_density_data = None
         gfw_data_available = {'fishing': False, 'shipping': False}
         
-        try:
-            # Fetch fishing pressure data
-            fishing_pressure_data = gfw_manager.fetch_fishing_effort(target_date, target_date)
-            if fishing_pressure_data is not None:
-                gfw_data_available['fishing'] = True
-                logger.info("Successfully retrieved fishing pressure data from GFW")
-            else:
-                logger.warning("Fishing pressure data unavailable - using neutral values")
-        except Exception as e:
-            logger.error(f"Error fetching fishing pressure data: {e}")
+        if isinstance(fishing_result, Exception):
+            logger.error(f"Error fetching fishing pressure data: {fishing_result}")
             logger.warning("Continuing with neutral fishing pressure")
+        elif fishing_result is not None:
+            fishing_pressure_data = fishing_result
+            gfw_data_available['fishing'] = True
+            logger.debug("Successfully retrieved fishing pressure data from GFW")
+        else:
+            logger.warning("Fishing pressure data unavailable - using neutral values")
         
-        try:
-            # Fetch shipping density data
-            shipping_density_data = gfw_manager.fetch_vessel_density(target_date, target_date)
-            if shipping_density_data is not None:
-                gfw_data_available['shipping'] = True
-                logger.info("Successfully retrieved shipping density data from GFW")
-            else:
-                logger.warning("Shipping density data unavailable - using neutral values")
-        except Exception as e:
-            logger.error(f"Error fetching shipping density data: {e}")
+        if isinstance(shipping_result, Exception):
+            logger.error(f"Error fetching shipping density data: {shipping_result}")
             logger.warning("Continuing with neutral shipping density")
+        elif shipping_result is not None:
+            shipping_density_data = shipping_result
+            gfw_data_available['shipping'] = True
+            logger.debug("Successfully retrieved shipping density data from GFW")
+        else:
+            logger.warning("Shipping density data unavailable - using neutral values")
+        
+        logger.info("GFW data availability: fishing=%s, shipping=%s", gfw_data_available['fishing'], gfw_data_available['shipping'])
         
-        logger.info(f"GFW data availability: fishing={gfw_data_available['fishing']}, shipping={gfw_data_available['shipping']}")
-        
-        # Validate dataset content (fail-fast check already done above, this is for additional validation)
-        for name, data in datasets.items():
-            if name == 'sst' and (not hasattr(data, 'data_vars') or not data.data_vars or 'sst' not in data.data_vars):
-                logger.error(f"SST dataset is empty or missing 'sst' variable - HSI calculation cannot proceed")
-                raise HTTPException(
-                    status_code=422,
-                    detail="SST dataset is empty or missing required 'sst' variable"
-                )
-            elif name == 'chlorophyll' and (not hasattr(data, 'data_vars') or not data.data_vars or 'chlorophyll' not in data.data_vars):
-                logger.warning(f"Chlorophyll dataset is empty or missing 'chlorophyll' variable")
-                raise HTTPException(
-                    status_code=422,
-                    detail="Chlorophyll dataset is empty or missing required 'chlorophyll' variable"
-                )
-            elif name == 'sea_level' and (not hasattr(data, 'data_vars') or not data.data_vars or 'sea_level' not in data.data_vars):
-                logger.warning(f"Sea level dataset is empty or missing 'sea_level' variable")
-                raise HTTPException(
-                    status_code=422,
-                    detail="Sea level dataset is empty or missing required 'sea_level' variable"
-                )
-            elif name == 'salinity' and (not hasattr(data, 'data_vars') or not data.data_vars or 'salinity' not in data.data_vars):
-                logger.error(f"Salinity dataset is empty or missing 'salinity' variable - HSI calculation cannot proceed")
-                raise HTTPException(
-                    status_code=422,
-                    detail="Salinity dataset is empty or missing required 'salinity' variable"
-                )
+        # Validate dataset content
+        missing = [
+            (label, variable) for name, (label, variable) in _REQUIRED_VARS.items()
+            if not _has_var(datasets.get(name), variable)
+        ]
+        if missing:
+            for label, variable in missing:
+                logger.error(f"{label} dataset is empty or missing '{variable}' variable - HSI calculation cannot proceed")
+            raise HTTPException(
+                status_code=422,
+                detail="Datasets empty or missing required variables: "
+                       + ", ".join(f"{label} ('{variable}')" for label, variable in missing)
+            )
         
         # Calculate HSI with optimized data (lagged data already in datasets)
+        # CPU-bound NumPy/xarray work runs on the shared compute pool to keep the event loop responsive
         try:
-            hsi_result = hsi_model.calculate_hsi(
+            hsi_result = await run_compute(
+                hsi_model.calculate_hsi,
                 chlorophyll_data=datasets['chlorophyll'],
                 sea_level_data=datasets['sea_level'],
                 sst_data=datasets['sst'],
@@ -257,117 +622,60 @@ async def get_hotspots(
             )
         
         # Calculate statistics
-        stats = hsi_model.get_hsi_statistics(hsi_result)
+        stats = await run_compute(hsi_model.get_hsi_statistics, hsi_result)
+        
+        # Metadata shared by both output formats
+        metadata = _build_base_metadata(
+            shark_species,
+            target_date,
+            stats,
+            lagged_dates,
+            lagged_chlorophyll_available=lagged_chlorophyll_data is not None,
+            lagged_sst_available=lagged_sst_data is not None,
+            gfw_data_available=gfw_data_available
+        )
         
         # Format response based on requested format
         if format.lower() == "geojson":
-            # Convert to GeoJSON for map visualization with caching
-            geojson_data = convert_hsi_to_geojson_cached(
+            # Convert to GeoJSON for map visualization with caching. Features come back
+            # already encoded, so the FeatureCollection is assembled from byte chunks
+            # instead of building (and re-encoding) one large Python object tree.
+            features_body = await run_compute(
+                convert_hsi_to_geojson_encoded,
                 hsi_result,
                 target_date=target_date,
                 shark_species=shark_species,
-                threshold=threshold
+                threshold=threshold,
+                hsi_model=hsi_model
             )
             
-            response_data = {
-                "type": "FeatureCollection",
-                "features": geojson_data,
-                "metadata": {
-                    "shark_species": shark_species,
-                    "target_date": target_date,
-                    "statistics": stats,
-                    "model_parameters": hsi_model.shark_profiles[shark_species].__dict__,
-                    "data_source": "NASA-SSH L4",
-                    "lagged_dates": lagged_dates,
-                    "lagged_data_available": {
-                        "chlorophyll": lagged_chlorophyll_data is not None,
-                        "temperature": lagged_sst_data is not None
-                    },
-                    "anthropogenic_data_available": gfw_data_available,
-                    "anthropogenic_data_source": gfw_manager.get_data_attribution(),
-                    "processing_area": "Global",
-                    "data_limitations": {
-                        "sea_level_coverage": "Enhanced coverage using combined ascending and descending passes, with fallback to gridded data",
-                        "missing_data_handling": "NASA-SSH built-in temporal merging within 10-day observation window, dual-pass geometry for improved spatial coverage",
-                        "temporal_merge": "NASA-SSH uses 10-day observations per grid with Gaussian weighted spatial averaging",
-                        "pass_combination": "Ascending and descending passes combined using xarray.concat for enhanced western hemisphere coverage"
-                    },
-                    "oceanographic_features": {
-                        "eddy_detection": {
-                            "method": "Gaussian normalization of Sea Level Anomaly (SLA)",
-                            "formula": "f_eddy = exp(-E'²/(2σ²)) where σ = 0.1m",
-                            "types": {
-                                "cyclonic_eddies": "Negative SLA, cold-core, upwelling, nutrient-rich",
-                                "anticyclonic_eddies": "Positive SLA, warm-core, downwelling, prey concentration"
-                            },
-                            "optimal_strength": "Moderate SLA values (±0.1m) provide highest shark foraging suitability",
-                            "size_range": "50-300 km diameter, captured by 0.5° grid resolution"
-                        },
-                        "front_detection": {
-                            "method": "Spatial gradient analysis of SLA",
-                            "formula": "|∇SLA| = √((∂SLA/∂lat)² + (∂SLA/∂lon)²)",
-                            "suitability": "f_front = exp(-|∇SLA|/σ_front) where σ_front = 0.05 m/degree",
-                            "characteristics": "Sharp boundaries between water masses, convergence zones where prey concentrates",
-                            "additional_fronts": "Thermal fronts detected through Sea Surface Temperature gradients"
-                        },
-                        "combined_suitability": {
-                            "formula": "f_E = 0.6 × f_eddy + 0.4 × f_front",
-                            "weighting": {
-                                "eddies": "60% - Primary foraging hotspots",
-                                "fronts": "40% - Secondary but important prey concentration zones"
-                            },
-                            "ecological_significance": "Both features drive prey aggregation through upwelling, convergence, and nutrient cycling"
-                        }
-                    },
-                    "nasa_challenge": {
-                        "challenge_name": "Sharks from Space",
-                        "challenge_year": "2025",
-                        "challenge_url": "https://www.spaceappschallenge.org/2025/challenges/sharks-from-space/",
-                        "nasa_mission": "Earth Science Division",
-                        "data_sources": "NASA Earthdata Cloud",
-                        "project_alignment": "Satellite-based shark habitat prediction using NASA oceanographic data"
-                    },
-                    "nasa_ssh_enhancements": {
-                        "user_guide_compliance": "Full implementation of NASA-SSH User Guide specifications",
-                        "quality_control": "Comprehensive flag handling (nasa_flag, median_filter_flag, source_flag)",
-                        "orbit_error_reduction": "OER correction applied for improved data quality",
-                        "basin_aware_processing": "Ocean basin connectivity rules implemented",
-                        "crossover_analysis": "Pass-to-pass validation for data quality assessment",
-                        "dual_pass_geometry": "Combined ascending and descending passes for enhanced spatial coverage",
-                        "basin_connectivity": "266 ocean basins with connectivity rules for geographically correlated regions",
-                        "dtu21_reference": "DTU21 Mean Sea Surface (1993-2012) reference information",
-                        "along_track_support": "High-resolution along-track data processing available",
-                        "oceanographic_features": "Enhanced eddy and front detection using NASA-SSH specifications"
-                    }
-                }
-            }
-            
-            # Ensure no NaN values in response
-            response_data = _clean_response_data(response_data)
-            return JSONResponse(content=response_data)
-            
+            # Only the per-request metadata is encoded here; the static block is pre-encoded
+            metadata_body = orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+            response = Response(
+                content=b"".join((
+                    b'{"type":"FeatureCollection","features":',
+                    features_body,
+                    b',"metadata":',
+                    metadata_body[:-1],
+                    b',',
+                    _STATIC_HOTSPOTS_METADATA_MEMBERS,
+                    b'}}'
+                )),
+                media_type="application/json",
+                headers=conditional_headers
+            )
         else:
             # Return raw data
-            response_data = {
-                "hsi_data": hsi_result.to_dict(),
-                "metadata": {
-                    "shark_species": shark_species,
-                    "target_date": target_date,
-                    "statistics": stats,
-                    "model_parameters": hsi_model.shark_profiles[shark_species].__dict__,
-                    "data_source": "NASA-SSH L4",
-                    "lagged_dates": lagged_dates,
-                    "lagged_data_available": {
-                        "chlorophyll": lagged_chlorophyll_data is not None,
-                        "temperature": lagged_sst_data is not None
-                    },
-                    "anthropogenic_data_available": gfw_data_available,
-                    "anthropogenic_data_source": gfw_manager.get_data_attribution(),
-                    "processing_area": "Global"
-                }
-            }
-            
-            return JSONResponse(content=response_data)
+            hsi_data = await run_compute(hsi_result.to_dict)
+            response = NumpyORJSONResponse(
+                content={
+                    "hsi_data": hsi_data,
+                    "metadata": metadata
+                },
+                headers=conditional_headers
+            )
+        
+        return await _cache_response(request, cache_key, response, target_date, cache_params, conditional_headers)
     
     except HTTPException:
         raise
@@ -375,30 +683,39 @@ async def get_hotspots(
         logger.error(f"Error processing hotspots request: {e}")
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+@router.get("/hotspots/metadata-static")
+async def get_hotspots_static_metadata(request: Request):
+    """
+    Get the static model documentation embedded in GeoJSON hotspots metadata
+
+    The content is fixed for the lifetime of the server, so clients can fetch it
+    once and revalidate with If-None-Match.
+    """
+    headers = {
+        "ETag": _STATIC_HOTSPOTS_METADATA_ETAG,
+        "Cache-Control": "public, max-age=86400"
+    }
+    if _etag_matches(request, _STATIC_HOTSPOTS_METADATA_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_STATIC_HOTSPOTS_METADATA_BODY, media_type="application/json", headers=headers)
+
 @router.get("/species")
 async def get_shark_species():
     """Get available shark species profiles"""
-    try:
-        profiles = hsi_model.get_shark_profiles()
-        return JSONResponse(content=profiles)
-    except Exception as e:
-        logger.error(f"Error getting shark species: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return Response(content=_SPECIES_BODY, media_type="application/json")
 
 @router.get("/datasets")
 async def get_dataset_info():
     """Get information about NASA datasets used"""
-    try:
-        dataset_info = nasa_manager.get_dataset_info()
-        return JSONResponse(content=dataset_info)
-    except Exception as e:
-        logger.error(f"Error getting dataset info: {e}")
-        raise HTTPException(status_code=500, detail="Internal server error")
+    return Response(content=_DATASETS_BODY, media_type="application/json")
 
 @router.get("/health")
 async def health_check():
     """Health check for the hotspots API"""
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    return Response(
+        content=_HEALTH_TEMPLATE % datetime.now().isoformat().encode(),
+        media_type="application/json"
+    )
 
 @router.post("/authenticate")
 async def authenticate_nasa(
@@ -421,6 +738,7 @@ async def cleanup_temp_files():
     """Clean up temporary files"""
     try:
         nasa_manager.cleanup_temp_files()
+        get_response_cache().invalidate()
         return {"status": "success", "message": "Temporary files cleaned up"}
     except Exception as e:
         logger.error(f"Cleanup error: {e}")
@@ -428,18 +746,14 @@ async def cleanup_temp_files():
 
 @router.get("/sea-level-availability")
 async def check_sea_level_availability(
-    target_date: str = Query(..., description="Target date in YYYY-MM-DD format")
+    target_day: date = Query(..., alias="target_date", description="Target date in YYYY-MM-DD format")
 ):
     """Check availability of sea level data around a target date"""
     try:
-        # Validate date format
-        try:
-            datetime.strptime(target_date, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        target_date = target_day.isoformat()
         
-        availability = nasa_manager.check_sea_level_availability(target_date)
-        return JSONResponse(content=availability)
+        availability = await run_io(nasa_manager.check_sea_level_availability, target_date)
+        return NumpyORJSONResponse(availability)
         
     except HTTPException:
         raise
@@ -449,7 +763,8 @@ async def check_sea_level_availability(
 
 @router.get("/along-track-data")
 async def get_along_track_data(
-    target_date: str = Query(..., description="Target date in YYYY-MM-DD format")
+    request: Request,
+    target_day: date = Query(..., alias="target_date", description="Target date in YYYY-MM-DD format")
 ):
     """
     Get NASA-SSH along-track data for higher resolution analysis
@@ -458,14 +773,21 @@ async def get_along_track_data(
     nadir measurements, offering higher resolution than gridded products.
     """
     try:
-        # Validate date format
-        try:
-            datetime.strptime(target_date, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+        target_date = target_day.isoformat()
+        
+        response_cache = get_response_cache()
+        cache_params = {"target_date": target_date}
+        cache_key = response_cache.build_key("along_track", **cache_params)
+        conditional_headers = _conditional_headers(target_day, cache_key)
+        if _etag_matches(request, conditional_headers.get("ETag")):
+            return Response(status_code=304, headers=conditional_headers)
+        
+        cached_response = response_cache.get(cache_key)
+        if cached_response is not None:
+            return await _stored_response(request, cached_response, conditional_headers)
 
-        # Download along-track data (no geographic filtering)
-        along_track_data = nasa_manager.download_along_track_data(target_date)
+        # Download along-track data (no geographic filtering) off the event loop
+        along_track_data = await run_io(nasa_manager.download_along_track_data, target_date)
         
         if along_track_data is None:
             raise HTTPException(
@@ -474,7 +796,8 @@ async def get_along_track_data(
             )
         
         # Convert to GeoJSON for visualization
-        geojson_data = convert_dataset_to_geojson(
+        geojson_data = await run_compute(
+            convert_dataset_to_geojson,
             along_track_data,
             'sea_level',
             threshold=0.0,
@@ -504,7 +827,15 @@ async def get_along_track_data(
             }
         }
         
-        return _clean_response_data(response_data)
+        return await _cache_response(
+            request,
+            cache_key,
+            NumpyORJSONResponse(content=response_data, headers=conditional_headers),
+            target_date,
+            cache_params,
+            conditional_headers,
+            namespace="along_track"
+        )
         
     except HTTPException:
         raise
@@ -514,7 +845,9 @@ async def get_along_track_data(
 
 @router.get("/combined-pass-data")
 async def get_combined_pass_data(
-    target_date: str = Query(..., description="Target date in YYYY-MM-DD format")
+    request: Request,
+    target_day: date = Query(..., alias="target_date", description="Target date in YYYY-MM-DD format"),
+    format: Literal["geojson", "flat"] = Query("geojson", description="Response format: 'geojson' or 'flat' (parallel coordinate/value arrays)")
 ):
     """
     Get NASA-SSH combined ascending and descending pass data for enhanced coverage
@@ -524,69 +857,101 @@ async def get_combined_pass_data(
 
     Args:
         target_date: Date in YYYY-MM-DD format
+        format: 'geojson' for a FeatureCollection of cell polygons, or 'flat' for a
+            FlatFeatureCollection of parallel 'lon', 'lat', 'sea_level', 'cell_width' and
+            'cell_height' arrays (one entry per cell, coordinates are cell centers)
 
     Returns:
-        GeoJSON representation of combined pass sea level data
+        GeoJSON (or flat array) representation of combined pass sea level data
     """
+    target_date = target_day.isoformat()
+    
+    response_cache = get_response_cache()
+    cache_params = {"target_date": target_date, "format": format}
+    cache_key = response_cache.build_key("combined_pass", **cache_params)
+    conditional_headers = _conditional_headers(target_day, cache_key)
+    if _etag_matches(request, conditional_headers.get("ETag")):
+        return Response(status_code=304, headers=conditional_headers)
+    
+    cached_response = response_cache.get(cache_key)
+    if cached_response is not None:
+        return await _stored_response(request, cached_response, conditional_headers)
+    
+    # Sea level data (no geographic filtering), shared with /hotspots through the
+    # dataset cache. The download runs on the I/O pool and is coalesced with any
+    # in-flight download of the same date.
     try:
-        # Validate inputs
-        try:
-            datetime.strptime(target_date, '%Y-%m-%d')
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
-
-        # Download sea level data (no geographic filtering)
-        logger.info(f"Downloading NASA-SSH data for {target_date}")
-        data = nasa_manager.download_data('sea_level', target_date)
-        
-        if data is None:
-            raise HTTPException(
-                status_code=404,
-                detail=f"No sea level data available for {target_date}"
-            )
-        
-        # Convert to GeoJSON
-        geojson_data = convert_dataset_to_geojson(
-            data,
-            'sea_level',
-            threshold=0.0,
-            density_factor=2  # Higher density for combined pass data
+        data = await _load_dataset('sea_level', target_date)
+    except Exception as e:
+        logger.error("Error downloading combined pass data for %s: %s", target_date, e)
+        raise HTTPException(status_code=502, detail=f"Error retrieving combined pass data: {str(e)}")
+    
+    if data is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No sea level data available for {target_date}"
         )
+    
+    try:
+        # Convert to GeoJSON features or flat coordinate/value arrays
+        if format == "flat":
+            flat_data = await run_compute(
+                convert_dataset_to_flat,
+                data,
+                'sea_level',
+                threshold=0.0,
+                density_factor=2  # Higher density for combined pass data
+            )
+            payload = {"type": "FlatFeatureCollection", **flat_data}
+            feature_count = len(flat_data['lon'])
+        else:
+            geojson_data = await run_compute(
+                convert_dataset_to_geojson,
+                data,
+                'sea_level',
+                threshold=0.0,
+                density_factor=2  # Higher density for combined pass data
+            )
+            payload = {"type": "FeatureCollection", "features": geojson_data}
+            feature_count = len(geojson_data)
         
-        response_data = {
-            "type": "FeatureCollection",
-            "features": geojson_data,
-            "metadata": {
-                "data_type": "combined_pass",
-                "target_date": target_date,
-                "feature_count": len(geojson_data),
-                "data_source": "NASA-SSH Combined Pass Data V1",
-                "resolution": "once-per-second sampling, 5-10 km diameter",
-                "processing": "19-point Gaussian-like normalized filter",
-                "quality_control": "Comprehensive flag handling and orbit error reduction",
-                "reference_surface": "DTU21 Mean Sea Surface (1993-2012)",
-                "satellite_missions": "TOPEX/Poseidon, Jason-1, Jason-2, Jason-3, Sentinel-6",
-                "pass_combination": data.attrs.get('pass_combination', 'unknown'),
-                "ascending_points": data.attrs.get('ascending_points', 0),
-                "descending_points": data.attrs.get('descending_points', 0),
-                "total_points": data.attrs.get('total_points', 0),
-                "coverage_enhancement": "Dual pass geometry for improved spatial coverage",
-                "combined_pass_features": {
-                    "dual_geometry": "Ascending and descending passes combined for complete coverage",
-                    "western_hemisphere": "Enhanced coverage in western hemisphere through dual pass geometry",
-                    "spatial_resolution": "Improved spatial sampling through multiple viewing angles",
-                    "data_quality": "Cross-validation between ascending and descending measurements"
-                }
-            }
-        }
-        
-        return _clean_response_data(response_data)
-        
-    except HTTPException:
-        raise
+        attrs = data.attrs
+        metadata_members = _encode_json({
+            "target_date": target_date,
+            "feature_count": feature_count,
+            "pass_combination": attrs.get('pass_combination', 'unknown'),
+            "ascending_points": attrs.get('ascending_points', 0),
+            "descending_points": attrs.get('descending_points', 0),
+            "total_points": attrs.get('total_points', 0)
+        })
+        payload_body = await run_compute(_encode_json, payload)
     except Exception as e:
-        logger.error(f"Error retrieving combined pass data: {e}")
-        raise HTTPException(status_code=500, detail=f"Error retrieving combined pass data: {str(e)}")
+        logger.error("Error converting combined pass data for %s: %s", target_date, e)
+        raise HTTPException(status_code=500, detail=f"Error converting combined pass data: {str(e)}")
+    
+    # Splice the encoded payload, the pre-encoded static metadata and the
+    # per-request metadata members (without their opening brace) into one object
+    response = Response(
+        content=b"".join((
+            payload_body[:-1],
+            b',"metadata":',
+            _COMBINED_PASS_METADATA_PREFIX,
+            metadata_members[1:],
+            b'}'
+        )),
+        media_type="application/json",
+        headers=conditional_headers
+    )
+    
+    return await _cache_response(
+        request,
+        cache_key,
+        response,
+        target_date,
+        cache_params,
+        conditional_headers,
+        namespace="combined_pass"
+    )
 
 @router.get("/cache/stats")
 async def get_cache_stats():
@@ -594,7 +959,14 @@ async def get_cache_stats():
     try:
         cache_manager = get_geojson_cache()
         stats = cache_manager.get_cache_stats()
-        return JSONResponse(content=stats)
+        stats['response_cache'] = get_response_cache().get_cache_stats()
+        stats['dataset_cache'] = {
+            'total_entries': len(_data_cache),
+            'max_entries': _DATA_CACHE_MAX_ENTRIES,
+            'ttl_seconds': _DATA_CACHE_TTL_SECONDS,
+            **_data_cache_stats
+        }
+        return NumpyORJSONResponse(stats)
     except Exception as e:
         logger.error(f"Error getting cache stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to get cache statistics")
@@ -609,6 +981,10 @@ async def invalidate_cache(
     try:
         cache_manager = get_geojson_cache()
         count = cache_manager.invalidate_cache(cache_type, target_date, shark_species)
+        if cache_type is None:
+            get_response_cache().invalidate(target_date=target_date, shark_species=shark_species)
+        elif cache_type == "hsi":
+            get_response_cache().invalidate("hotspots", target_date=target_date, shark_species=shark_species)
         return {"status": "success", "invalidated_entries": count}
     except Exception as e:
         logger.error(f"Error invalidating cache: {e}")
@@ -620,34 +996,57 @@ async def clear_cache():
     try:
         cache_manager = get_geojson_cache()
         count = cache_manager.clear_all_cache()
+        get_response_cache().clear()
         return {"status": "success", "cleared_files": count}
     except Exception as e:
         logger.error(f"Error clearing cache: {e}")
         raise HTTPException(status_code=500, detail="Failed to clear cache")
 
+class _CleanupParams(NamedTuple):
+    """Request parameters passed to every cache cleanup handler"""
+    days_old: int
+    max_size_mb: int
+    ttl_hours: int
+
+# Cache cleanup modes: cleanup_type -> (response key, handler)
+_CLEANUP_HANDLERS = {
+    "maintenance": ("results", lambda params: run_maintenance_cleanup()),
+    "expired": ("cleaned_entries", lambda params: cleanup_expired_cache(params.ttl_hours)),
+    "old": ("cleaned_entries", lambda params: cleanup_old_cache_by_date(params.days_old)),
+    "size": ("cleaned_entries", lambda params: cleanup_cache_by_size(params.max_size_mb))
+}
+
+_inflight_cleanups: Dict[Tuple[str, _CleanupParams], asyncio.Future] = {}
+
+async def _run_cleanup(cleanup_type: str, params: _CleanupParams) -> Any:
+    """Run a cache cleanup, coalescing concurrent calls for the same type and parameters"""
+    cleanup_key = (cleanup_type, params)
+    cleanup = _inflight_cleanups.get(cleanup_key)
+    if cleanup is None:
+        _, handler = _CLEANUP_HANDLERS[cleanup_type]
+        # Cache sweeps walk the cache directory; run them on the I/O pool so the
+        # event loop keeps serving other requests meanwhile
+        cleanup = asyncio.ensure_future(run_io(handler, params))
+        _inflight_cleanups[cleanup_key] = cleanup
+        cleanup.add_done_callback(lambda _: _inflight_cleanups.pop(cleanup_key, None))
+    else:
+        logger.info("Joining in-flight %s cache cleanup", cleanup_type)
+    
+    # Shield so a disconnected caller does not cancel the sweep shared with other callers
+    return await asyncio.shield(cleanup)
+
 @router.post("/cache/cleanup")
 async def cleanup_cache(
-    cleanup_type: str = Query("maintenance", description="Type of cleanup: 'maintenance', 'expired', 'old', 'size'"),
-    days_old: int = Query(7, description="Days old threshold for 'old' cleanup"),
-    max_size_mb: int = Query(500, description="Maximum size in MB for 'size' cleanup"),
-    ttl_hours: int = Query(24, description="TTL in hours for 'expired' cleanup")
+    cleanup_type: Literal["maintenance", "expired", "old", "size"] = Query("maintenance", description="Type of cleanup: 'maintenance', 'expired', 'old', 'size'"),
+    days_old: int = Query(7, ge=1, le=3650, description="Days old threshold for 'old' cleanup"),
+    max_size_mb: int = Query(500, ge=1, le=1_000_000, description="Maximum size in MB for 'size' cleanup"),
+    ttl_hours: int = Query(24, ge=1, le=24 * 365, description="TTL in hours for 'expired' cleanup")
 ):
     """Clean up GeoJSON cache data"""
+    result_key, _ = _CLEANUP_HANDLERS[cleanup_type]
     try:
-        if cleanup_type == "maintenance":
-            results = run_maintenance_cleanup()
-            return {"status": "success", "results": results}
-        elif cleanup_type == "expired":
-            count = cleanup_expired_cache(ttl_hours)
-            return {"status": "success", "cleaned_entries": count}
-        elif cleanup_type == "old":
-            count = cleanup_old_cache_by_date(days_old)
-            return {"status": "success", "cleaned_entries": count}
-        elif cleanup_type == "size":
-            count = cleanup_cache_by_size(max_size_mb)
-            return {"status": "success", "cleaned_entries": count}
-        else:
-            raise HTTPException(status_code=400, detail="Invalid cleanup type. Use: maintenance, expired, old, size")
+        result = await _run_cleanup(cleanup_type, _CleanupParams(days_old, max_size_mb, ttl_hours))
+        return {"status": "success", result_key: result}
     except Exception as e:
         logger.error(f"Error during cache cleanup: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to cleanup cache: {str(e)}")
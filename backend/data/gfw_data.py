@@ -15,10 +15,14 @@ import xarray as xr
 import numpy as np
 import pandas as pd
 import os
+import re
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
 import logging
 from pathlib import Path
 
@@ -26,6 +30,9 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Column name patterns for GFW report DataFrames (matched against lowercased names)
+_VALUE_COLUMN_RE = re.compile(r'fishing|effort|hours|value|count|density')
+
 
 class GFWDataManager:
     """Manages Global Fishing Watch API access and local caching using official GFW client"""
@@ -54,6 +61,16 @@ class GFWDataManager:
             logger.error(f"Failed to initialize GFW client: {e}")
             self.client = None
         
+        # Persistent event loop (started on first use) that runs every call on self.client,
+        # so the client's connection pool is reused instead of rebuilt per request
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        
+        # In-memory LRU in front of the NetCDF cache: path -> (file mtime, dataset)
+        self.memory_cache_max_entries = 16
+        self._memory_cache: "OrderedDict[str, Tuple[float, xr.Dataset]]" = OrderedDict()
+        self._memory_cache_lock = threading.Lock()
+        
         # Get cache directory from environment variable or use default
         if cache_dir is None:
             cache_dir = os.getenv("CACHE_DIR", "data_cache")
@@ -69,32 +86,176 @@ class GFWDataManager:
         self.lat_range = (-90, 90)
         self.lon_range = (-180, 180)
         
+        # Grid coordinates (cell centers) and bin edges depend only on the configuration
+        # above, so build them once and share them read-only across gridding calls
+        # NASA grid: -90 to 90 (361 points) and -180 to 180 (721 points)
+        self._lat_coords = np.arange(self.lat_range[0], self.lat_range[1] + self.grid_resolution, self.grid_resolution)
+        self._lon_coords = np.arange(self.lon_range[0], self.lon_range[1] + self.grid_resolution, self.grid_resolution)
+        # Bin edges (not centers); each cell covers (edge_i, edge_i+1], the first one closed
+        self._lat_bins = np.arange(self.lat_range[0] - self.grid_resolution/2,
+                                   self.lat_range[1] + self.grid_resolution,
+                                   self.grid_resolution)
+        self._lon_bins = np.arange(self.lon_range[0] - self.grid_resolution/2,
+                                   self.lon_range[1] + self.grid_resolution,
+                                   self.grid_resolution)
+        for grid_array in (self._lat_coords, self._lon_coords, self._lat_bins, self._lon_bins):
+            grid_array.setflags(write=False)
+        self._grid_shape = (len(self._lat_coords), len(self._lon_coords))
+        
         logger.info(f"GFW Data Manager initialized with cache dir: {self.cache_dir}")
         if self.client:
             logger.info("GFW API client ready for data requests")
         else:
             logger.warning("GFW API client not available - will return neutral pressure values")
     
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop for GFW client calls, starting it on first use"""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="gfw-client-loop", daemon=True).start()
+                self._loop = loop
+            return self._loop
+    
+    def _run_client_call(self, coro, timeout: float = 60) -> Any:
+        """
+        Run a GFW client coroutine on the persistent background loop and wait for its result
+        
+        Args:
+            coro: Coroutine from self.client (e.g. client.fourwings.create_fishing_effort_report(...))
+            timeout: Seconds to wait before cancelling the call
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._get_loop())
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+    
+    def _run_client_calls(self, coros: List[Any], timeout: float = 60) -> List[Any]:
+        """
+        Run several GFW client coroutines concurrently on the persistent background loop
+        
+        Each call gets its own timeout, so one slow call does not hold up the others.
+        
+        Returns:
+            Results in input order; failed or timed-out calls are returned as their exception
+        """
+        async def gather_calls():
+            return await asyncio.gather(
+                *(asyncio.wait_for(coro, timeout) for coro in coros),
+                return_exceptions=True
+            )
+        
+        return asyncio.run_coroutine_threadsafe(gather_calls(), self._get_loop()).result()
+    
+    def _fetch_region_dataframes(self, create_report: Any, ocean_regions: List[Dict],
+                                 api_start_date: date, api_end_date: date) -> List[pd.DataFrame]:
+        """
+        Fetch a 4Wings report for every region concurrently and extract the non-empty DataFrames
+        
+        Args:
+            create_report: Client report method (e.g. self.client.fourwings.create_fishing_effort_report)
+            ocean_regions: Regions with 'name' and 'geojson' keys
+            api_start_date: First day of the queried period
+            api_end_date: Last day of the queried period
+        """
+        # Use DAILY temporal resolution for single day, MONTHLY for ranges
+        temporal_res = 'DAILY' if api_start_date == api_end_date else 'MONTHLY'
+        logger.info(f"Fetching {len(ocean_regions)} region(s)")
+        reports = self._run_client_calls(
+            [
+                create_report(
+                    start_date=api_start_date,
+                    end_date=api_end_date,
+                    spatial_resolution='LOW',
+                    temporal_resolution=temporal_res,
+                    geojson=region['geojson']
+                )
+                for region in ocean_regions
+            ],
+            timeout=60  # Increased timeout for larger regions
+        )
+        
+        dataframes = []
+        for i, (region, report) in enumerate(zip(ocean_regions, reports), 1):
+            if isinstance(report, BaseException):
+                logger.warning(f"Failed to fetch region {i}: {report}")
+                continue
+            
+            try:
+                # Extract dataframe from report
+                if hasattr(report, 'df'):
+                    df_data = report.df() if callable(report.df) else report.df
+                    if df_data is not None and hasattr(df_data, 'empty') and not df_data.empty:
+                        dataframes.append(df_data)
+                        logger.info(f"✓ {region['name']}: {len(df_data):,} records")
+                    elif df_data is None or (hasattr(df_data, 'empty') and df_data.empty):
+                        # Empty dataframe - try data() method
+                        if hasattr(report, 'data'):
+                            data_content = report.data() if callable(report.data) else report.data
+                            if data_content and len(data_content) > 0:
+                                df_data = pd.DataFrame(data_content)
+                                if not df_data.empty:
+                                    dataframes.append(df_data)
+                                    logger.info(f"✓ {region['name']}: {len(df_data):,} records")
+                    
+            except Exception as e:
+                logger.warning(f"Failed to read region {i} report: {e}")
+                continue
+        
+        return dataframes
+    
+    def close(self):
+        """Stop the background event loop used for GFW client calls"""
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+    
     def _get_cache_path(self, dataset: str, date_str: str, bounds: Optional[Dict] = None) -> Path:
         """Generate cache file path for a dataset and date"""
         if bounds:
-            bounds_hash = hash(f"{bounds.get('north')}_{bounds.get('south')}_{bounds.get('east')}_{bounds.get('west')}")
+            # Stable digest over fixed-precision bounds (builtin hash() is salted per process,
+            # so files written before a restart would never be found again)
+            bounds_key = "_".join(
+                f"{float(bounds[side]):.4f}" if bounds.get(side) is not None else "none"
+                for side in ('north', 'south', 'east', 'west')
+            )
+            bounds_hash = hashlib.blake2b(bounds_key.encode(), digest_size=8).hexdigest()
             filename = f"{dataset}_{date_str}_bounds_{bounds_hash}.nc"
         else:
             filename = f"{dataset}_{date_str}_global.nc"
         return self.cache_dir / filename
     
+    def _remember(self, cache_path: Path, mtime: float, data: xr.Dataset):
+        """Keep a cached dataset in the in-memory LRU"""
+        with self._memory_cache_lock:
+            self._memory_cache[str(cache_path)] = (mtime, data)
+            self._memory_cache.move_to_end(str(cache_path))
+            while len(self._memory_cache) > self.memory_cache_max_entries:
+                self._memory_cache.popitem(last=False)
+    
     def _is_cached(self, dataset: str, date_str: str, bounds: Optional[Dict] = None) -> bool:
         """Check if data is already cached and valid"""
         cache_path = self._get_cache_path(dataset, date_str, bounds)
         
-        if not cache_path.exists():
+        # Datasets held in memory carry their file mtime, so no stat() is needed
+        with self._memory_cache_lock:
+            entry = self._memory_cache.get(str(cache_path))
+        if entry is not None:
+            mtime = entry[0]
+        elif cache_path.exists():
+            mtime = cache_path.stat().st_mtime
+        else:
             return False
         
         # Check cache age
-        cache_age_days = (datetime.now() - datetime.fromtimestamp(cache_path.stat().st_mtime)).days
+        cache_age_days = (datetime.now() - datetime.fromtimestamp(mtime)).days
         if cache_age_days > self.cache_ttl_days:
             logger.info(f"Cache expired for {dataset} on {date_str} (age: {cache_age_days} days)")
+            with self._memory_cache_lock:
+                self._memory_cache.pop(str(cache_path), None)
             return False
         
         logger.info(f"Valid cache found for {dataset} on {date_str}")
@@ -104,7 +265,21 @@ class GFWDataManager:
         """Save data to cache"""
         try:
             cache_path = self._get_cache_path(dataset, date_str, bounds)
-            data.to_netcdf(cache_path)
+            # Light deflate with byte shuffling: pressure grids are mostly zeros, so level 1
+            # already compresses well and level 9 would only add CPU time
+            encoding = {
+                name: {
+                    'zlib': True,
+                    'complevel': 1,
+                    'shuffle': True,
+                    'dtype': 'float32',
+                    'chunksizes': tuple(min(size, chunk) for size, chunk in zip(var.shape, (180, 360)))
+                }
+                for name, var in data.data_vars.items()
+                if var.ndim == 2
+            }
+            data.to_netcdf(cache_path, encoding=encoding, engine='netcdf4')
+            self._remember(cache_path, cache_path.stat().st_mtime, data)
             logger.info(f"Cached {dataset} data for {date_str}")
         except Exception as e:
             logger.error(f"Failed to cache data: {e}")
@@ -113,9 +288,23 @@ class GFWDataManager:
         """Load data from cache"""
         try:
             cache_path = self._get_cache_path(dataset, date_str, bounds)
-            data = xr.open_dataset(cache_path, decode_timedelta=False)
+            with self._memory_cache_lock:
+                entry = self._memory_cache.get(str(cache_path))
+                if entry is not None:
+                    self._memory_cache.move_to_end(str(cache_path))
+            if entry is not None:
+                logger.info(f"Loaded {dataset} data from memory cache for {date_str}")
+                # Shallow copy so callers cannot change the cached dataset's attrs/variables
+                return entry[1].copy(deep=False)
+            
+            # Read the whole grid once and release the file handle, instead of keeping a
+            # lazily-backed dataset that re-reads the NetCDF file during HSI calculation
+            mtime = cache_path.stat().st_mtime
+            with xr.open_dataset(cache_path, decode_timedelta=False) as cached:
+                data = cached.load()
+            self._remember(cache_path, mtime, data)
             logger.info(f"Loaded {dataset} data from cache for {date_str}")
-            return data
+            return data.copy(deep=False)
         except Exception as e:
             logger.error(f"Failed to load cached data: {e}")
             return None
@@ -141,8 +330,8 @@ class GFWDataManager:
             # Use the exact requested date from API
             # Convert string to datetime.date object (GFW client accepts both)
             from datetime import datetime
-            api_start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-            api_end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+            api_start_date = date.fromisoformat(start_date)
+            api_end_date = date.fromisoformat(end_date)
             logger.info(f"Querying GFW fishing effort: {api_start_date} to {api_end_date}")
             
             if not self.client:
@@ -166,37 +355,16 @@ class GFWDataManager:
                 logger.info("Using client.fourwings.create_fishing_effort_report() method")
                 
                 # Create fishing effort report using 4Wings API (ASYNC)
-                # Run in separate thread with fresh client to avoid event loop conflicts
-                # Each thread gets its own event loop and GFW client instance
-                def run_in_thread():
-                    """Run GFW API call in isolated thread with own event loop and client"""
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        # Create fresh GFW client in this thread
-                        fresh_client = gfw.Client(access_token=self.api_key)
-                        
-                        # Create and run the coroutine
-                        coro = fresh_client.fourwings.create_fishing_effort_report(
-                            start_date=api_start_date,
-                            end_date=api_end_date,
-                            spatial_resolution='LOW',
-                            temporal_resolution='MONTHLY'
-                        )
-                        
-                        result = new_loop.run_until_complete(coro)
-                        new_loop.run_until_complete(asyncio.sleep(0))  # Allow cleanup
-                        return result
-                    finally:
-                        try:
-                            new_loop.run_until_complete(new_loop.shutdown_asyncgens())
-                        except Exception:
-                            pass
-                        new_loop.close()
-                
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(run_in_thread)
-                    report = future.result(timeout=60)
+                # Runs on the shared client's persistent event loop
+                report = self._run_client_call(
+                    self.client.fourwings.create_fishing_effort_report(
+                        start_date=api_start_date,
+                        end_date=api_end_date,
+                        spatial_resolution='LOW',
+                        temporal_resolution='MONTHLY'
+                    ),
+                    timeout=60
+                )
                 
                 logger.info(f"GFW API returned data type: {type(report)}")
                 
@@ -248,8 +416,8 @@ class GFWDataManager:
             # Use the exact requested date from API
             # Convert string to datetime.date object (GFW client accepts both)
             from datetime import datetime
-            api_start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-            api_end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+            api_start_date = date.fromisoformat(start_date)
+            api_end_date = date.fromisoformat(end_date)
             logger.info(f"Querying GFW vessel density: {api_start_date} to {api_end_date}")
             
             if not self.client:
@@ -273,37 +441,16 @@ class GFWDataManager:
                 logger.info("Using client.fourwings.create_ais_presence_report() method")
                 
                 # Create AIS presence report for all vessel activity (ASYNC)
-                # Run in separate thread with fresh client to avoid event loop conflicts
-                # Each thread gets its own event loop and GFW client instance
-                def run_in_thread():
-                    """Run GFW API call in isolated thread with own event loop and client"""
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        # Create fresh GFW client in this thread
-                        fresh_client = gfw.Client(access_token=self.api_key)
-                        
-                        # Create and run the coroutine
-                        coro = fresh_client.fourwings.create_ais_presence_report(
-                            start_date=api_start_date,
-                            end_date=api_end_date,
-                            spatial_resolution='LOW',
-                            temporal_resolution='MONTHLY'
-                        )
-                        
-                        result = new_loop.run_until_complete(coro)
-                        new_loop.run_until_complete(asyncio.sleep(0))  # Allow cleanup
-                        return result
-                    finally:
-                        try:
-                            new_loop.run_until_complete(new_loop.shutdown_asyncgens())
-                        except Exception:
-                            pass
-                        new_loop.close()
-                
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(run_in_thread)
-                    report = future.result(timeout=60)
+                # Runs on the shared client's persistent event loop
+                report = self._run_client_call(
+                    self.client.fourwings.create_ais_presence_report(
+                        start_date=api_start_date,
+                        end_date=api_end_date,
+                        spatial_resolution='LOW',
+                        temporal_resolution='MONTHLY'
+                    ),
+                    timeout=60
+                )
                 
                 logger.info(f"GFW API returned data type: {type(report)}")
                 
@@ -371,28 +518,25 @@ class GFWDataManager:
             logger.error("Returning neutral (zero) dataset for anthropogenic pressure")
             return self._create_neutral_dataset(variable_name)
     
-    def _process_dataframe(self, df: pd.DataFrame, variable_name: str) -> xr.Dataset:
-        """Process pandas DataFrame from GFW client"""
-        logger.info(f"Gridding {len(df):,} records to global 0.5° grid...")
-        
-        # Try to find lat/lon columns
+    def _identify_columns(self, df: pd.DataFrame) -> Tuple[Any, Any, Any]:
+        """Find the lat, lon and value columns of a GFW report DataFrame"""
         lat_col = None
         lon_col = None
         value_col = None
         
-        for col in df.columns:
-            # Handle both string and integer column names
-            col_str = str(col).lower() if not isinstance(col, str) else col.lower()
-            
-            if 'lat' in col_str:
-                lat_col = col
-            if 'lon' in col_str:
-                lon_col = col
-            if any(x in col_str for x in ['fishing', 'effort', 'hours', 'value', 'count', 'density']):
-                value_col = col
+        # Integer column names never contain the patterns, so skip the lowercase pass
+        if df.columns.dtype.kind not in 'iu':
+            # Last matching column wins for each role
+            for col, col_str in zip(df.columns, df.columns.astype(str).str.lower()):
+                if 'lat' in col_str:
+                    lat_col = col
+                if 'lon' in col_str:
+                    lon_col = col
+                if _VALUE_COLUMN_RE.search(col_str):
+                    value_col = col
         
         # If columns are integers, identify by position
-        if lat_col is None and isinstance(df.columns[0], int):
+        if lat_col is None and isinstance(df.columns[0], (int, np.integer)):
             # Standard GFW column positions: lat=-2, lon=-1, hours=4
             if len(df.columns) >= 2:
                 lat_col = df.columns[-2]
@@ -400,43 +544,72 @@ class GFWDataManager:
             if len(df.columns) > 4:
                 value_col = df.columns[4]
         
-        if lat_col and lon_col and value_col:
-            logger.info(f"Found columns: lat={lat_col}, lon={lon_col}, value={value_col}")
-            return self._grid_dataframe(df, lat_col, lon_col, value_col, variable_name)
-        else:
-            logger.error(f"Could not identify required columns in DataFrame: {list(df.columns)}")
-            logger.error("Returning neutral (zero) dataset")
-            return self._create_neutral_dataset(variable_name)
+        return lat_col, lon_col, value_col
     
-    def _grid_dataframe(self, df: pd.DataFrame, lat_col: str, lon_col: str, value_col: str, variable_name: str) -> xr.Dataset:
-        """Grid DataFrame data to common resolution matching NASA grid"""
-        # Create coordinate arrays matching NASA grid exactly
-        # NASA grid: -90 to 90 (361 points) and -180 to 180 (721 points)
-        lat_coords = np.arange(self.lat_range[0], self.lat_range[1] + self.grid_resolution, self.grid_resolution)
-        lon_coords = np.arange(self.lon_range[0], self.lon_range[1] + self.grid_resolution, self.grid_resolution)
-        
-        # Create bins for pd.cut (edges, not centers)
-        lat_bins = np.arange(self.lat_range[0] - self.grid_resolution/2, 
-                            self.lat_range[1] + self.grid_resolution, 
-                            self.grid_resolution)
-        lon_bins = np.arange(self.lon_range[0] - self.grid_resolution/2, 
-                            self.lon_range[1] + self.grid_resolution, 
-                            self.grid_resolution)
+    def _process_dataframe(self, df: pd.DataFrame, variable_name: str) -> xr.Dataset:
+        """Process pandas DataFrame from GFW client"""
+        return self._process_dataframes([df], variable_name)
+    
+    def _process_dataframes(self, dataframes: List[pd.DataFrame], variable_name: str) -> xr.Dataset:
+        """
+        Grid one or more GFW DataFrames into a single global grid
         
-        # Bin the data
-        df = df.copy()
-        df['lat_bin'] = pd.cut(df[lat_col], bins=lat_bins, labels=lat_coords, include_lowest=True)
-        df['lon_bin'] = pd.cut(df[lon_col], bins=lon_bins, labels=lon_coords, include_lowest=True)
+        Each frame is binned straight into the shared grid, so multi-region results are
+        never concatenated into one combined DataFrame. The list is consumed as it goes.
+        """
+        logger.info(f"Gridding {sum(len(df) for df in dataframes):,} records from {len(dataframes)} DataFrame(s) to global 0.5° grid...")
         
-        # Aggregate by bins
-        gridded = df.groupby(['lat_bin', 'lon_bin'], observed=True)[value_col].sum().unstack(fill_value=0)
+        grid = np.zeros(self._grid_shape, dtype=np.float32)
+        gridded_frames = 0
         
-        # Reindex to full global grid (fills missing bins with 0)
-        gridded = gridded.reindex(index=lat_coords, columns=lon_coords, fill_value=0)
+        while dataframes:
+            # Drop each frame once it has been binned to release its memory early
+            df = dataframes.pop()
+            lat_col, lon_col, value_col = self._identify_columns(df)
+            
+            if lat_col and lon_col and value_col:
+                logger.info(f"Found columns: lat={lat_col}, lon={lon_col}, value={value_col}")
+                self._accumulate_into_grid(df, grid, lat_col, lon_col, value_col)
+                gridded_frames += 1
+            else:
+                logger.error(f"Could not identify required columns in DataFrame: {list(df.columns)}")
+            del df
         
-        # Convert to numpy array
-        gridded_array = gridded.values
+        if gridded_frames == 0:
+            logger.error("Returning neutral (zero) dataset")
+            return self._create_neutral_dataset(variable_name)
         
+        return self._grid_to_dataset(grid, variable_name)
+    
+    def _accumulate_into_grid(self, df: pd.DataFrame, grid: np.ndarray, lat_col: Any, lon_col: Any, value_col: Any):
+        """Add the DataFrame's values into grid (lat x lon, matching the NASA grid) in place"""
+        lat_bins = self._lat_bins
+        lon_bins = self._lon_bins
+        n_lat, n_lon = grid.shape
+        
+        # Bin the records with one searchsorted per axis and sum them with a single
+        # bincount over flat cell indices (no Categorical columns, groupby or reindex)
+        lats = np.asarray(df[lat_col], dtype=np.float64)
+        lons = np.asarray(df[lon_col], dtype=np.float64)
+        values = np.nan_to_num(np.asarray(df[value_col], dtype=np.float64))
+        lat_idx = np.searchsorted(lat_bins, lats, side='left') - 1
+        lon_idx = np.searchsorted(lon_bins, lons, side='left') - 1
+        lat_idx[lats == lat_bins[0]] = 0
+        lon_idx[lons == lon_bins[0]] = 0
+        
+        # Records outside the grid (or with NaN coordinates) are dropped
+        in_grid = (lat_idx >= 0) & (lat_idx < n_lat) & (lon_idx >= 0) & (lon_idx < n_lon)
+        cell_idx = lat_idx[in_grid] * n_lon + lon_idx[in_grid]
+        # bincount sums each frame in float64; the float32 grid keeps ~7 significant
+        # digits, ample for values the HSI model normalizes to [0, 1]
+        grid += np.bincount(
+            cell_idx,
+            weights=values[in_grid],
+            minlength=n_lat * n_lon
+        ).reshape(n_lat, n_lon)
+    
+    def _grid_to_dataset(self, gridded_array: np.ndarray, variable_name: str) -> xr.Dataset:
+        """Wrap an aggregated grid in an xarray Dataset on the NASA grid coordinates"""
         # DO NOT normalize here - the HSI model will normalize it
         # Just return raw aggregated values (fishing hours or vessel counts)
         # This avoids double normalization which crushes the signal
@@ -448,8 +621,8 @@ class GFWDataManager:
                 variable_name: (['lat', 'lon'], pressure)
             },
             coords={
-                'lat': lat_coords,
-                'lon': lon_coords
+                'lat': self._lat_coords,
+                'lon': self._lon_coords
             }
         )
         
@@ -503,7 +676,7 @@ class GFWDataManager:
         # Extract the month from the requested date and query the entire month
         from datetime import datetime, timedelta
         
-        requested_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+        requested_date = date.fromisoformat(start_date)
         target_year = requested_date.year
         target_month = requested_date.month
         
@@ -517,65 +690,14 @@ class GFWDataManager:
         
         logger.info(f"Querying full month: {api_start_date.strftime('%B %Y')} ({api_start_date} to {api_end_date})")
         
-        # Fetch data for each region
-        all_dataframes = []
-        successful_regions = 0
-        
-        for i, region in enumerate(ocean_regions, 1):
-            try:
-                logger.info(f"Fetching region {i}/{len(ocean_regions)}: {region['name']}")
-                
-                # Fetch data for this region in a separate thread
-                def fetch_region():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        fresh_client = gfw.Client(access_token=self.api_key)
-                        # Use DAILY temporal resolution for single day, MONTHLY for ranges
-                        temporal_res = 'DAILY' if api_start_date == api_end_date else 'MONTHLY'
-                        
-                        coro = fresh_client.fourwings.create_fishing_effort_report(
-                            start_date=api_start_date,
-                            end_date=api_end_date,
-                            spatial_resolution='LOW',
-                            temporal_resolution=temporal_res,
-                            geojson=region['geojson']
-                        )
-                        result = new_loop.run_until_complete(coro)
-                        new_loop.run_until_complete(asyncio.sleep(0))
-                        return result
-                    finally:
-                        try:
-                            new_loop.run_until_complete(new_loop.shutdown_asyncgens())
-                        except Exception:
-                            pass
-                        new_loop.close()
-                
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(fetch_region)
-                    report = future.result(timeout=60)  # Increased timeout for larger regions
-                
-                # Extract dataframe from report
-                if hasattr(report, 'df'):
-                    df_data = report.df() if callable(report.df) else report.df
-                    if df_data is not None and hasattr(df_data, 'empty') and not df_data.empty:
-                        all_dataframes.append(df_data)
-                        successful_regions += 1
-                        logger.info(f"✓ {region['name']}: {len(df_data):,} records")
-                    elif df_data is None or (hasattr(df_data, 'empty') and df_data.empty):
-                        # Empty dataframe - try data() method
-                        if hasattr(report, 'data'):
-                            data_content = report.data() if callable(report.data) else report.data
-                            if data_content and len(data_content) > 0:
-                                df_data = pd.DataFrame(data_content)
-                                if not df_data.empty:
-                                    all_dataframes.append(df_data)
-                                    successful_regions += 1
-                                    logger.info(f"✓ {region['name']}: {len(df_data):,} records")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to fetch region {i}: {e}")
-                continue
+        # Fetch all regions concurrently on the shared client's event loop
+        all_dataframes = self._fetch_region_dataframes(
+            self.client.fourwings.create_fishing_effort_report,
+            ocean_regions,
+            api_start_date,
+            api_end_date
+        )
+        successful_regions = len(all_dataframes)
         
         if successful_regions == 0:
             logger.warning(f"No fishing effort data available for {api_start_date.strftime('%B %Y')}")
@@ -584,12 +706,8 @@ class GFWDataManager:
         
         logger.info(f"Successfully fetched {successful_regions}/{len(ocean_regions)} ocean regions")
         
-        # Combine all dataframes
-        combined_df = pd.concat(all_dataframes, ignore_index=True)
-        logger.info(f"Combined {len(combined_df):,} total records from {successful_regions} regions")
-        
-        # Process combined dataframe
-        return self._process_dataframe(combined_df, 'fishing_pressure')
+        # Bin each region's records straight into one grid (no combined DataFrame copy)
+        return self._process_dataframes(all_dataframes, 'fishing_pressure')
     
     def _fetch_global_vessel_density(self, start_date: str, end_date: str) -> Optional[xr.Dataset]:
         """
@@ -608,7 +726,7 @@ class GFWDataManager:
         # Extract the month from the requested date and query the entire month
         from datetime import datetime, timedelta
         
-        requested_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+        requested_date = date.fromisoformat(start_date)
         target_year = requested_date.year
         target_month = requested_date.month
         
@@ -622,65 +740,14 @@ class GFWDataManager:
         
         logger.info(f"Querying full month: {api_start_date.strftime('%B %Y')} ({api_start_date} to {api_end_date})")
         
-        # Fetch data for each region
-        all_dataframes = []
-        successful_regions = 0
-        
-        for i, region in enumerate(ocean_regions, 1):
-            try:
-                logger.info(f"Fetching region {i}/{len(ocean_regions)}: {region['name']}")
-                
-                # Fetch data for this region in a separate thread
-                def fetch_region():
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        fresh_client = gfw.Client(access_token=self.api_key)
-                        # Use DAILY temporal resolution for single day, MONTHLY for ranges
-                        temporal_res = 'DAILY' if api_start_date == api_end_date else 'MONTHLY'
-                        
-                        coro = fresh_client.fourwings.create_ais_presence_report(
-                            start_date=api_start_date,
-                            end_date=api_end_date,
-                            spatial_resolution='LOW',
-                            temporal_resolution=temporal_res,
-                            geojson=region['geojson']
-                        )
-                        result = new_loop.run_until_complete(coro)
-                        new_loop.run_until_complete(asyncio.sleep(0))
-                        return result
-                    finally:
-                        try:
-                            new_loop.run_until_complete(new_loop.shutdown_asyncgens())
-                        except Exception:
-                            pass
-                        new_loop.close()
-                
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(fetch_region)
-                    report = future.result(timeout=60)  # Increased timeout for larger regions
-                
-                # Extract dataframe from report
-                if hasattr(report, 'df'):
-                    df_data = report.df() if callable(report.df) else report.df
-                    if df_data is not None and hasattr(df_data, 'empty') and not df_data.empty:
-                        all_dataframes.append(df_data)
-                        successful_regions += 1
-                        logger.info(f"✓ {region['name']}: {len(df_data):,} records")
-                    elif df_data is None or (hasattr(df_data, 'empty') and df_data.empty):
-                        # Empty dataframe - try data() method
-                        if hasattr(report, 'data'):
-                            data_content = report.data() if callable(report.data) else report.data
-                            if data_content and len(data_content) > 0:
-                                df_data = pd.DataFrame(data_content)
-                                if not df_data.empty:
-                                    all_dataframes.append(df_data)
-                                    successful_regions += 1
-                                    logger.info(f"✓ {region['name']}: {len(df_data):,} records")
-                    
-            except Exception as e:
-                logger.warning(f"Failed to fetch region {i}: {e}")
-                continue
+        # Fetch all regions concurrently on the shared client's event loop
+        all_dataframes = self._fetch_region_dataframes(
+            self.client.fourwings.create_ais_presence_report,
+            ocean_regions,
+            api_start_date,
+            api_end_date
+        )
+        successful_regions = len(all_dataframes)
         
         if successful_regions == 0:
             logger.warning(f"No vessel density data available for {api_start_date.strftime('%B %Y')}")
@@ -689,12 +756,8 @@ class GFWDataManager:
         
         logger.info(f"Successfully fetched {successful_regions}/{len(ocean_regions)} ocean regions")
         
-        # Combine all dataframes
-        combined_df = pd.concat(all_dataframes, ignore_index=True)
-        logger.info(f"Combined data shape: {combined_df.shape}")
-        
-        # Process combined dataframe
-        return self._process_dataframe(combined_df, 'shipping_density')
+        # Bin each region's records straight into one grid (no combined DataFrame copy)
+        return self._process_dataframes(all_dataframes, 'shipping_density')
     
     def _create_neutral_dataset(self, variable_name: str) -> xr.Dataset:
         """
@@ -710,12 +773,8 @@ class GFWDataManager:
         logger.warning(f"GFW data unavailable - using neutral {variable_name} dataset (zeros = no anthropogenic pressure)")
         logger.warning("To use real GFW data, set the GFW_API_KEY environment variable")
         
-        # Create grid matching NASA data resolution
-        lats = np.arange(self.lat_range[0], self.lat_range[1] + self.grid_resolution, self.grid_resolution)
-        lons = np.arange(self.lon_range[0], self.lon_range[1] + self.grid_resolution, self.grid_resolution)
-        
-        # Create zeros array (no anthropogenic pressure)
-        zeros = np.zeros((len(lats), len(lons)))
+        # Create zeros array (no anthropogenic pressure) on the NASA grid
+        zeros = np.zeros(self._grid_shape, dtype=np.float32)
         
         # Create xarray Dataset
         dataset = xr.Dataset(
@@ -723,8 +782,8 @@ class GFWDataManager:
                 variable_name: (['lat', 'lon'], zeros)
             },
             coords={
-                'lat': lats,
-                'lon': lons
+                'lat': self._lat_coords,
+                'lon': self._lon_coords
             }
         )
         
@@ -753,6 +812,8 @@ class GFWDataManager:
                         continue
                 
                 cache_file.unlink()
+                with self._memory_cache_lock:
+                    self._memory_cache.pop(str(cache_file), None)
                 count += 1
             
             logger.info(f"Cleared {count} cached GFW files")
@@ -13,11 +13,19 @@ import earthaccess
 import xarray as xr
 import numpy as np
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
 from typing import Optional, Dict, Any, List
 import logging
 from pathlib import Path
 
+# HTTP status codes worth retrying (rate limiting and transient gateway errors)
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -80,6 +88,24 @@ class NASADataManager:
         self.lat_range = (-90, 90)
         self.lon_range = (-180, 180)
         
+        # Earthdata request limits: cap concurrent searches/downloads across all requests
+        # so one heavy request cannot starve others, and back off on rate limiting
+        self.max_concurrent_requests = int(os.getenv("NASA_MAX_CONCURRENT_REQUESTS", "4"))
+        self.max_retries = int(os.getenv("NASA_MAX_RETRIES", "3"))
+        self.retry_backoff_seconds = 1.0
+        self._request_semaphore = threading.BoundedSemaphore(self.max_concurrent_requests)
+        
+        # Sea level coverage memo (date -> (has_coverage, checked_at)); availability
+        # does not change hour-to-hour, so repeated requests skip the CMR search
+        self.sea_level_fallback_window_days = 30
+        self.coverage_ttl_seconds = 3600
+        self._sea_level_coverage: "OrderedDict[str, tuple]" = OrderedDict()
+        self._coverage_lock = threading.Lock()
+        
+        # Authenticated HTTPS session reused across granule downloads, so consecutive
+        # downloads keep pooled keep-alive connections instead of re-handshaking TLS
+        self._https_session: Optional[requests.Session] = None
+        self._https_session_lock = threading.Lock()
         
         # Automatically authenticate with NASA Earthdata
         # self._auto_authenticate()
@@ -155,6 +181,12 @@ class NASADataManager:
         cache_path = self.cache_dir / f"{dataset}_{date_str}.nc"
         return cache_path.exists()
     
+    def is_cached(self, dataset: str, target_date: str) -> bool:
+        """Check if download_data would be served from the local cache for a dataset and YYYY-MM-DD date"""
+        # Same cache keys as download_data: salinity is time-insensitive, others use YYYYMMDD
+        date_str = 'latest' if dataset == 'salinity' else target_date.replace('-', '')
+        return self._is_cached(dataset, date_str)
+    
     def _save_to_cache(self, data: xr.Dataset, dataset: str, date_str: str):
         """Save data to cache"""
         cache_path = self.cache_dir / f"{dataset}_{date_str}.nc"
@@ -165,13 +197,83 @@ class NASADataManager:
         """Load data from cache"""
         cache_path = self.cache_dir / f"{dataset}_{date_str}.nc"
         try:
-            data = xr.open_dataset(cache_path, decode_timedelta=False)
+            # Materialize while still on the I/O thread so later HSI work never touches disk
+            with xr.open_dataset(cache_path, decode_timedelta=False) as cached:
+                data = cached.load()
             logger.info(f"Loaded {dataset} data from cache for {date_str}")
             return data
         except Exception as e:
             logger.error(f"Failed to load cached data: {e}")
             return None
     
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Check whether a failed Earthdata call is worth retrying"""
+        response = getattr(error, 'response', None)
+        status_code = getattr(response, 'status_code', None)
+        if status_code is not None:
+            return status_code in RETRYABLE_STATUS_CODES
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                                  ConnectionError, TimeoutError))
+    
+    def _call_with_retry(self, func, *args, **kwargs):
+        """
+        Call an Earthdata function under the shared concurrency limit,
+        retrying transient failures with exponential backoff
+        """
+        attempt = 0
+        while True:
+            with self._request_semaphore:
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt >= self.max_retries or not self._is_retryable_error(e):
+                        raise
+                    delay = self.retry_backoff_seconds * (2 ** attempt)
+                    logger.warning(f"{getattr(func, '__name__', 'Earthdata call')} failed ({e}), retrying in {delay:.1f}s")
+            # Sleep outside the semaphore so waiting callers can proceed
+            time.sleep(delay)
+            attempt += 1
+    
+    def _get_https_session(self) -> Optional[requests.Session]:
+        """Get the shared authenticated Earthdata HTTPS session (None if it cannot be created)"""
+        with self._https_session_lock:
+            if self._https_session is None:
+                try:
+                    session = earthaccess.get_requests_https_session()
+                except Exception as e:
+                    logger.warning(f"Could not create Earthdata HTTPS session: {e}")
+                    return None
+                session.mount("https://", HTTPAdapter(pool_maxsize=self.max_concurrent_requests))
+                self._https_session = session
+            return self._https_session
+    
+    def _download_granule(self, granule, local_dir: Path) -> List[str]:
+        """
+        Download a granule's data file over the shared HTTPS session
+        
+        Falls back to earthaccess.download when no session or HTTPS link is available.
+        """
+        session = self._get_https_session()
+        links = [link for link in granule.data_links(access="external") if link.startswith("https://")] if session else []
+        if not links:
+            return earthaccess.download([granule], local_path=str(local_dir))
+        
+        url = links[0]
+        file_path = local_dir / url.rsplit("/", 1)[-1]
+        with session.get(url, stream=True, timeout=(10, 300)) as response:
+            response.raise_for_status()
+            with open(file_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+        return [str(file_path)]
+    
+    def close(self):
+        """Close the shared HTTPS session"""
+        with self._https_session_lock:
+            if self._https_session is not None:
+                self._https_session.close()
+                self._https_session = None
+    
     def search_data(self, dataset: str, start_date: str, end_date: str) -> List[Dict]:
         """Search for data granules"""
         try:
@@ -213,7 +315,7 @@ class NASADataManager:
                 logger.info("Note: OISSS L4 has monthly temporal resolution")
             
             logger.info(f"Search parameters: {search_params}")
-            results = earthaccess.search_data(**search_params)
+            results = self._call_with_retry(earthaccess.search_data, **search_params)
             
             logger.info(f"Found {len(results)} granules for {dataset}")
             
@@ -233,7 +335,7 @@ class NASADataManager:
                         'temporal': (start_date, end_date),
                         'count': 50  # Search more broadly
                     }
-                    broader_results = earthaccess.search_data(**broader_params)
+                    broader_results = self._call_with_retry(earthaccess.search_data, **broader_params)
                     logger.info(f"Broader search found {len(broader_results)} granules")
                     
                     if broader_results:
@@ -281,8 +383,9 @@ class NASADataManager:
                 # Default 7-day window for other datasets
                 search_window = 7
             
-            start_date = (datetime.strptime(target_date, '%Y-%m-%d') - timedelta(days=search_window)).strftime('%Y-%m-%d')
-            end_date = (datetime.strptime(target_date, '%Y-%m-%d') + timedelta(days=search_window)).strftime('%Y-%m-%d')
+            target_day = date.fromisoformat(target_date)
+            start_date = (target_day - timedelta(days=search_window)).isoformat()
+            end_date = (target_day + timedelta(days=search_window)).isoformat()
             
             logger.info(f"Searching for {dataset} data in range: {start_date} to {end_date} (window: ±{search_window} days)")
             results = self.search_data(dataset, start_date, end_date)
@@ -291,9 +394,10 @@ class NASADataManager:
                 logger.warning(f"No data found for {dataset} on {target_date}")
                 # For sea level data, try a much broader search
                 if dataset == 'sea_level':
-                    logger.info("Attempting much broader search for sea level data (30 days range)...")
-                    broader_start = (datetime.strptime(target_date, '%Y-%m-%d') - timedelta(days=30)).strftime('%Y-%m-%d')
-                    broader_end = (datetime.strptime(target_date, '%Y-%m-%d') + timedelta(days=30)).strftime('%Y-%m-%d')
+                    window = self.sea_level_fallback_window_days
+                    logger.info(f"Attempting much broader search for sea level data ({window} days range)...")
+                    broader_start = (target_day - timedelta(days=window)).isoformat()
+                    broader_end = (target_day + timedelta(days=window)).isoformat()
                     broader_results = self.search_data(dataset, broader_start, broader_end)
                     if broader_results:
                         logger.info(f"Found {len(broader_results)} granules in broader search")
@@ -313,7 +417,7 @@ class NASADataManager:
             temp_dir.mkdir(parents=True, exist_ok=True)
             
             logger.info(f"Downloading to: {temp_dir}")
-            files = earthaccess.download([granule], local_path=str(temp_dir))
+            files = self._call_with_retry(self._download_granule, granule, temp_dir)
             
             if files:
                 # Load the downloaded file
@@ -447,10 +551,11 @@ class NASADataManager:
             # Extract sea surface height anomaly data
             ssha_data = data[sl_var]
             
-            # Count valid data points before processing
-            valid_count_before = (~np.isnan(ssha_data.values)).sum()
-            total_count = ssha_data.size
-            logger.info(f"SSH data before processing: {valid_count_before}/{total_count} valid points ({100*valid_count_before/total_count:.1f}%)")
+            # Count valid data points before processing (single non-NaN reduction)
+            if logger.isEnabledFor(logging.INFO):
+                valid_count_before = int(ssha_data.count())
+                total_count = ssha_data.size
+                logger.info(f"SSH data before processing: {valid_count_before}/{total_count} valid points ({100*valid_count_before/total_count:.1f}%)")
             
             # Apply orbit error reduction (OER) correction if available
             ssha_data = self._apply_orbit_error_reduction(data, ssha_data)
@@ -1157,20 +1262,21 @@ class NASADataManager:
                 method='linear'
             )
             
-            # Log coverage after regridding
-            main_var = list(regridded.data_vars)[0]
-            valid_after = (~np.isnan(regridded[main_var].values)).sum()
-            total_after = regridded[main_var].size
-            logger.info(f"{var_name} after regridding: {valid_after}/{total_after} valid points ({100*valid_after/total_after:.1f}%)")
-            
-            # Check longitude coverage in the regridded data
-            if 'lon' in regridded.coords:
-                lon_with_data = []
-                for lon_val in regridded.lon.values:
-                    if np.any(~np.isnan(regridded[main_var].sel(lon=lon_val).values)):
-                        lon_with_data.append(float(lon_val))
-                if lon_with_data:
-                    logger.info(f"{var_name} longitude coverage: {min(lon_with_data):.2f}° to {max(lon_with_data):.2f}°")
+            # Log coverage after regridding (diagnostics only, skipped when INFO is off)
+            if logger.isEnabledFor(logging.INFO):
+                main_var = list(regridded.data_vars)[0]
+                valid_mask = regridded[main_var].notnull()
+                valid_after = int(valid_mask.sum())
+                total_after = regridded[main_var].size
+                logger.info(f"{var_name} after regridding: {valid_after}/{total_after} valid points ({100*valid_after/total_after:.1f}%)")
+                
+                # Check longitude coverage in the regridded data with one reduction over the other dims
+                if 'lon' in valid_mask.dims:
+                    other_dims = [dim for dim in valid_mask.dims if dim != 'lon']
+                    lon_has_data = valid_mask.any(dim=other_dims).values if other_dims else valid_mask.values
+                    lon_with_data = regridded.lon.values[lon_has_data]
+                    if lon_with_data.size:
+                        logger.info(f"{var_name} longitude coverage: {lon_with_data.min():.2f}° to {lon_with_data.max():.2f}°")
             
             return regridded
             
@@ -1254,9 +1360,10 @@ class NASADataManager:
             ]
             
             results = {}
+            target_day = date.fromisoformat(target_date)
             for range_name, days in date_ranges:
-                start_date = (datetime.strptime(target_date, '%Y-%m-%d') - timedelta(days=days)).strftime('%Y-%m-%d')
-                end_date = (datetime.strptime(target_date, '%Y-%m-%d') + timedelta(days=days)).strftime('%Y-%m-%d')
+                start_date = (target_day - timedelta(days=days)).isoformat()
+                end_date = (target_day + timedelta(days=days)).isoformat()
                 
                 logger.info(f"Checking {range_name} range: {start_date} to {end_date}")
                 granules = self.search_data('sea_level', start_date, end_date)
@@ -1278,6 +1385,50 @@ class NASADataManager:
             logger.error(f"Error checking sea level availability: {e}")
             return {'error': str(e)}
     
+    def has_sea_level_coverage(self, target_date: str) -> Optional[bool]:
+        """
+        Check whether download_data can find sea level data for a date
+        
+        Looks for any granule within the sea level fallback window. Results are
+        memoized per date; a locally cached file counts as coverage without a search.
+        
+        Returns:
+            True/False, or None if the check itself failed (caller should not short-circuit)
+        """
+        if self.is_cached('sea_level', target_date):
+            return True
+        
+        with self._coverage_lock:
+            memoized = self._sea_level_coverage.get(target_date)
+            if memoized is not None and time.monotonic() - memoized[1] < self.coverage_ttl_seconds:
+                return memoized[0]
+        
+        try:
+            window = self.sea_level_fallback_window_days
+            target_day = date.fromisoformat(target_date)
+            start_date = (target_day - timedelta(days=window)).isoformat()
+            end_date = (target_day + timedelta(days=window)).isoformat()
+            granules = self._call_with_retry(
+                earthaccess.search_data,
+                short_name=self.datasets['sea_level']['short_name'],
+                temporal=(start_date, end_date),
+                cloud_hosted=True,
+                count=1
+            )
+        except Exception as e:
+            logger.warning(f"Sea level coverage check failed for {target_date}: {e}")
+            return None
+        
+        has_coverage = len(granules) > 0
+        with self._coverage_lock:
+            self._sea_level_coverage[target_date] = (has_coverage, time.monotonic())
+            self._sea_level_coverage.move_to_end(target_date)
+            while len(self._sea_level_coverage) > 1024:
+                self._sea_level_coverage.popitem(last=False)
+        
+        logger.info(f"Sea level coverage for {target_date}: {has_coverage}")
+        return has_coverage
+    
     def get_dataset_info(self) -> Dict[str, Dict[str, Any]]:
         """Get information about available datasets"""
         return {
@@ -6,7 +6,7 @@ Main FastAPI application entry point
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 from datetime import datetime, date
@@ -20,11 +20,13 @@ load_dotenv()
 from api.routes import hotspots
 from models.hsi_model import HSIModel
 from data.nasa_data import NASADataManager
+from utils.executors import shutdown_executors
 
 app = FastAPI(
     title="Shark Foraging Hotspot Prediction API",
     description="API for predicting global shark foraging hotspots using NASA satellite data",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for frontend communication
@@ -47,6 +49,13 @@ app.add_middleware(
 # Include API routes
 app.include_router(hotspots.router, prefix="/api", tags=["hotspots"])
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release shared thread pools, the NASA HTTPS session and the GFW client loop on shutdown"""
+    shutdown_executors()
+    hotspots.nasa_manager.close()
+    hotspots.gfw_manager.close()
+
 @app.get("/")
 async def root():
     """Root endpoint - serves the frontend"""
@@ -9,12 +9,13 @@ demonstrating satellite-based shark habitat prediction using NASA oceanographic
 Challenge URL: https://www.spaceappschallenge.org/2025/challenges/sharks-from-space/
 """
 
+import hashlib
 import numpy as np
 import xarray as xr
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, Union
 import logging
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
@@ -598,6 +599,9 @@ class HSIModel:
                 }
             })
             
+            # Content hash lets downstream converters memoize on the computed grid
+            result.attrs['content_hash'] = self._compute_content_hash(result)
+            
             # Log final statistics
             hsi_mean = float(hsi.mean().values)
             hsi_max = float(hsi.max().values)
@@ -612,6 +616,17 @@ class HSIModel:
             logger.error(traceback.format_exc())
             raise
     
+    def _compute_content_hash(self, result: xr.Dataset) -> str:
+        """Compute a stable hash of all result variables (shape, dtype and values)"""
+        hasher = hashlib.blake2b(digest_size=16)
+        for var_name in sorted(result.data_vars):
+            values = np.ascontiguousarray(result[var_name].values)
+            hasher.update(var_name.encode())
+            hasher.update(str(values.shape).encode())
+            hasher.update(values.dtype.str.encode())
+            hasher.update(values.tobytes())
+        return hasher.hexdigest()
+    
     def _normalize_chlorophyll(self, chl: xr.DataArray) -> xr.DataArray:
         """
         Normalize chlorophyll concentration
@@ -702,20 +717,23 @@ class HSIModel:
             # Both positive (anticyclonic) and negative (cyclonic) eddies are important
             # NASA-SSH provides high-quality data with orbit error reduction applied
             sigma_e = 0.1  # Standard deviation for eddy strength normalization (NASA-SSH optimized)
-            eddy_suitability = np.exp(-(sla_clean ** 2) / (2 * sigma_e ** 2))
-            
-            # Log NASA-SSH eddy detection statistics
-            eddy_stats = {
-                'mean_sla': float(sla_clean.mean().values) if not np.isnan(sla_clean.mean().values) else 0.0,
-                'std_sla': float(sla_clean.std().values) if not np.isnan(sla_clean.std().values) else 0.0,
-                'cyclonic_eddies': float((sla_clean < -0.05).sum().values),  # Negative SLA > 5cm
-                'anticyclonic_eddies': float((sla_clean > 0.05).sum().values)  # Positive SLA > 5cm
-            }
-            
-            logger.info(f"NASA-SSH eddy detection statistics:")
-            logger.info(f"  Mean SLA: {eddy_stats['mean_sla']:.4f}m, Std: {eddy_stats['std_sla']:.4f}m")
-            logger.info(f"  Cyclonic eddies (SLA < -0.05m): {eddy_stats['cyclonic_eddies']:.0f} points")
-            logger.info(f"  Anticyclonic eddies (SLA > 0.05m): {eddy_stats['anticyclonic_eddies']:.0f} points")
+            # Evaluated in place on one buffer (square, scale, exp) instead of allocating
+            # a temporary array for every operator
+            sla_values = np.asarray(sla_clean.values, dtype=np.float64)
+            eddy_values = np.square(sla_values)
+            eddy_values *= -1.0 / (2 * sigma_e ** 2)
+            np.exp(eddy_values, out=eddy_values)
+            eddy_suitability = sla_clean.copy(data=eddy_values)
+            
+            # Log NASA-SSH eddy detection statistics (each reduction computed once)
+            if logger.isEnabledFor(logging.INFO):
+                valid_sla = sla_values[~np.isnan(sla_values)]
+                mean_sla = float(valid_sla.mean()) if valid_sla.size else 0.0
+                std_sla = float(valid_sla.std()) if valid_sla.size else 0.0
+                logger.info(f"NASA-SSH eddy detection statistics:")
+                logger.info(f"  Mean SLA: {mean_sla:.4f}m, Std: {std_sla:.4f}m")
+                logger.info(f"  Cyclonic eddies (SLA < -0.05m): {np.count_nonzero(valid_sla < -0.05)} points")
+                logger.info(f"  Anticyclonic eddies (SLA > 0.05m): {np.count_nonzero(valid_sla > 0.05)} points")
             
             # STEP 3: COMBINE EDDY AND FRONT SUITABILITY (NASA-SSH Enhanced)
             # Both features contribute to prey concentration but with different weights
@@ -1229,33 +1247,37 @@ class HSIModel:
             for species, profile in self.shark_profiles.items()
         }
     
-    def calculate_lagged_dates(self, target_date: str, shark_species: str) -> Dict[str, str]:
+    def calculate_lagged_dates(self, target_date: Union[str, date], shark_species: str) -> Dict[str, str]:
         """
         Calculate lagged dates for trophic lag implementation
         
         Args:
-            target_date: Target date in YYYY-MM-DD format
+            target_date: Target date as a date object or YYYY-MM-DD string
+                (pass the already-parsed date to skip re-parsing)
             shark_species: Species name
             
         Returns:
             Dictionary with lagged dates for chlorophyll and temperature
         """
-        from datetime import datetime, timedelta
-        
         if shark_species not in self.shark_profiles:
             raise ValueError(f"Unknown shark species: {shark_species}")
         
         profile = self.shark_profiles[shark_species]
-        target_dt = datetime.strptime(target_date, '%Y-%m-%d')
+        if isinstance(target_date, datetime):
+            target_dt = target_date.date()
+        elif isinstance(target_date, date):
+            target_dt = target_date
+        else:
+            target_dt = date.fromisoformat(target_date)
         
         # Calculate lagged dates
         chlorophyll_lag_date = target_dt - timedelta(days=profile.c_lag)
         temperature_lag_date = target_dt - timedelta(days=profile.t_lag)
         
         return {
-            'target_date': target_date,
-            'chlorophyll_lag_date': chlorophyll_lag_date.strftime('%Y-%m-%d'),
-            'temperature_lag_date': temperature_lag_date.strftime('%Y-%m-%d'),
+            'target_date': target_dt.isoformat(),
+            'chlorophyll_lag_date': chlorophyll_lag_date.isoformat(),
+            'temperature_lag_date': temperature_lag_date.isoformat(),
             'chlorophyll_lag_days': profile.c_lag,
             'temperature_lag_days': profile.t_lag
         }
@@ -1374,6 +1396,97 @@ class HSIModel:
                 'topographic_absolute': 0.0
             }
     
+    def calculate_component_contributions_batch(self,
+                                                i_phys: np.ndarray,
+                                                i_prey: np.ndarray,
+                                                i_topo: np.ndarray,
+                                                i_anthro: np.ndarray,
+                                                profile: SharkProfile) -> List[Dict[str, float]]:
+        """
+        Vectorized calculate_component_contributions() for many cells at once
+        
+        The arithmetic runs as whole-array NumPy operations and each column is
+        converted to Python floats once, instead of one function call per cell.
+        Returns the same per-cell dictionaries as calculate_component_contributions().
+        
+        Args:
+            i_phys, i_prey, i_topo, i_anthro: 1D index arrays (no NaN values)
+            profile: Shark species profile with weights
+        
+        Returns:
+            List of contribution dictionaries, one per cell
+        """
+        i_phys = np.asarray(i_phys, dtype=np.float64)
+        i_prey = np.asarray(i_prey, dtype=np.float64)
+        i_topo = np.asarray(i_topo, dtype=np.float64)
+        i_anthro = np.asarray(i_anthro, dtype=np.float64)
+        
+        phys_absolute = profile.w_phys * i_phys
+        prey_absolute = profile.w_prey * i_prey
+        topo_absolute = profile.w_topo * i_topo
+        base_hsi = phys_absolute + prey_absolute + topo_absolute
+        final_hsi = base_hsi * (1.0 - i_anthro)
+        
+        zero_base = base_hsi == 0
+        safe_base = np.where(zero_base, 1.0, base_hsi)
+        
+        columns = zip(
+            zero_base.tolist(),
+            ((phys_absolute / safe_base) * 100).tolist(),
+            ((prey_absolute / safe_base) * 100).tolist(),
+            ((topo_absolute / safe_base) * 100).tolist(),
+            (i_anthro * 100).tolist(),
+            base_hsi.tolist(),
+            final_hsi.tolist(),
+            phys_absolute.tolist(),
+            prey_absolute.tolist(),
+            topo_absolute.tolist(),
+            i_phys.tolist(),
+            i_prey.tolist(),
+            i_topo.tolist(),
+            i_anthro.tolist()
+        )
+        
+        # Edge case where base_hsi is zero (matches calculate_component_contributions)
+        zero_base_contributions = {
+            'physicochemical_pct': profile.w_phys * 100,
+            'prey_pct': profile.w_prey * 100,
+            'topographic_pct': profile.w_topo * 100,
+            'anthropogenic_reduction_pct': 0.0,
+            'base_hsi': 0.0,
+            'final_hsi': 0.0,
+            'physicochemical_absolute': 0.0,
+            'prey_absolute': 0.0,
+            'topographic_absolute': 0.0
+        }
+        
+        contributions = []
+        for (is_zero, phys_pct, prey_pct, topo_pct, anthro_pct, base, final,
+             phys_abs, prey_abs, topo_abs, phys_raw, prey_raw, topo_raw, anthro_raw) in columns:
+            if is_zero:
+                contributions.append(dict(zero_base_contributions))
+                continue
+            contributions.append({
+                'physicochemical_pct': phys_pct,
+                'prey_pct': prey_pct,
+                'topographic_pct': topo_pct,
+                'anthropogenic_reduction_pct': anthro_pct,
+                'base_hsi': base,
+                'final_hsi': final,
+                'physicochemical_absolute': phys_abs,
+                'prey_absolute': prey_abs,
+                'topographic_absolute': topo_abs,
+                'weight_physicochemical': profile.w_phys,
+                'weight_prey': profile.w_prey,
+                'weight_topographic': profile.w_topo,
+                'i_phys_raw': phys_raw,
+                'i_prey_raw': prey_raw,
+                'i_topo_raw': topo_raw,
+                'i_anthro_raw': anthro_raw
+            })
+        
+        return contributions
+    
     def calculate_legacy_component_contributions(self, f_c: float, f_e: float, f_s: float, 
                                                  profile: SharkProfile) -> Dict[str, float]:
         """
@@ -1416,13 +1529,13 @@ class HSIModel:
     def get_hsi_statistics(self, hsi_data: xr.Dataset) -> Dict[str, Any]:
         """Calculate statistics for HSI data"""
         try:
-            hsi = hsi_data['hsi']
-            
-            # Filter out NaN values for statistics
-            hsi_valid = hsi.where(~np.isnan(hsi))
+            # Extract the valid (non-NaN) values once and reduce the flat array,
+            # instead of re-scanning the masked grid for every statistic
+            hsi_values = np.asarray(hsi_data['hsi'].values).ravel()
+            valid_values = hsi_values[~np.isnan(hsi_values)]
             
             # Check if we have any valid data
-            if hsi_valid.count() == 0:
+            if valid_values.size == 0:
                 logger.warning("No valid HSI data for statistics calculation")
                 return {
                     'mean': 0.0,
@@ -1435,24 +1548,19 @@ class HSIModel:
                     'valid_points': 0
                 }
             
-            stats = {
-                'mean': float(hsi_valid.mean().values),
-                'std': float(hsi_valid.std().values),
-                'min': float(hsi_valid.min().values),
-                'max': float(hsi_valid.max().values),
-                'percentile_90': float(hsi_valid.quantile(0.9).values),
-                'percentile_95': float(hsi_valid.quantile(0.95).values),
-                'percentile_99': float(hsi_valid.quantile(0.99).values),
-                'valid_points': int(hsi_valid.count().values)
-            }
-            
-            # Replace any remaining NaN values with 0
-            for key, value in stats.items():
-                if isinstance(value, float) and np.isnan(value):
-                    stats[key] = 0.0
-                    logger.warning(f"Replaced NaN in {key} with 0.0")
+            # All three percentiles from a single partition of the data
+            p90, p95, p99 = np.percentile(valid_values, [90, 95, 99])
             
-            return stats
+            return {
+                'mean': float(valid_values.mean()),
+                'std': float(valid_values.std()),
+                'min': float(valid_values.min()),
+                'max': float(valid_values.max()),
+                'percentile_90': float(p90),
+                'percentile_95': float(p95),
+                'percentile_99': float(p99),
+                'valid_points': int(valid_values.size)
+            }
             
         except Exception as e:
             logger.error(f"HSI statistics calculation failed: {e}")
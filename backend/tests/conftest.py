@@ -0,0 +1,8 @@
+"""
+Pytest configuration: make the backend packages (api, data, models, utils) importable
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
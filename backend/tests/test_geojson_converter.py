@@ -0,0 +1,94 @@
+"""
+Tests for the vectorized dataset-to-GeoJSON conversion
+"""
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from utils.geojson_converter import convert_dataset_to_geojson
+
+
+def _reference_features(data_var: xr.DataArray, variable: str, threshold: float, density_factor: int):
+    """Per-cell conversion equivalent to the original loop-based implementation"""
+    lats = data_var.lat.values
+    lons = data_var.lon.values
+    features = []
+    for i, lat in enumerate(lats[:-1]):
+        if i % density_factor != 0:
+            continue
+        for j, lon in enumerate(lons[:-1]):
+            if j % density_factor != 0:
+                continue
+            value_raw = data_var.isel(lat=i, lon=j).values
+            if np.isnan(value_raw):
+                continue
+            value = float(value_raw.item())
+            if value >= threshold:
+                lat_step = (lats[i + 1] - lat) * density_factor
+                lon_step = (lons[j + 1] - lon) * density_factor
+                features.append({
+                    "coordinates": [[lon, lat], [lon + lon_step, lat], [lon + lon_step, lat + lat_step],
+                                    [lon, lat + lat_step], [lon, lat]],
+                    "properties": {
+                        variable: value,
+                        "lat": float(lat + lat_step / 2),
+                        "lon": float(lon + lon_step / 2)
+                    }
+                })
+    return features
+
+
+def _sample_grid() -> xr.DataArray:
+    """Small global-style grid with NaN (land) cells and values on both sides of the threshold"""
+    rng = np.random.default_rng(42)
+    lats = np.arange(-30, 30.5, 0.5)
+    lons = np.arange(-60, 60.5, 0.5)
+    values = rng.uniform(-1.0, 1.0, size=(len(lats), len(lons)))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    return xr.DataArray(values, coords={'lat': lats, 'lon': lons}, dims=['lat', 'lon'])
+
+
+def _assert_matches_reference(features, reference, variable: str):
+    assert len(features) == len(reference)
+    for feature, expected in zip(features, reference):
+        assert feature["geometry"]["type"] == "Polygon"
+        np.testing.assert_allclose(feature["geometry"]["coordinates"][0], expected["coordinates"], atol=1e-6)
+        assert feature["properties"][variable] == pytest.approx(expected["properties"][variable])
+        assert feature["properties"]["lat"] == pytest.approx(expected["properties"]["lat"], abs=1e-6)
+        assert feature["properties"]["lon"] == pytest.approx(expected["properties"]["lon"], abs=1e-6)
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.25])
+def test_convert_dataset_to_geojson_matches_per_cell_conversion(threshold):
+    data_var = _sample_grid()
+    dataset = xr.Dataset({'sea_level': data_var})
+
+    features = convert_dataset_to_geojson(dataset, 'sea_level', threshold=threshold, density_factor=4)
+
+    reference = _reference_features(data_var, 'sea_level', threshold, 4)
+    assert reference
+    _assert_matches_reference(features, reference, 'sea_level')
+
+
+def test_convert_dataset_to_geojson_squeezes_singleton_time_dimension():
+    data_var = _sample_grid()
+    # Regridded NASA data keeps a length-1 time axis in front of lat/lon
+    timed = data_var.expand_dims(time=[np.datetime64('2024-01-01')])
+    dataset = xr.Dataset({'sea_level': timed})
+
+    features = convert_dataset_to_geojson(dataset, 'sea_level', threshold=0.0, density_factor=4)
+
+    reference = _reference_features(timed, 'sea_level', 0.0, 4)
+    assert reference
+    _assert_matches_reference(features, reference, 'sea_level')
+    assert features == convert_dataset_to_geojson(xr.Dataset({'sea_level': data_var}), 'sea_level', 0.0, 4)
+
+
+def test_convert_dataset_to_geojson_oceanographic_reads_sea_level():
+    data_var = _sample_grid()
+    dataset = xr.Dataset({'sea_level': data_var.expand_dims(time=1).transpose('lat', 'time', 'lon')})
+
+    features = convert_dataset_to_geojson(dataset, 'oceanographic', threshold=0.0, density_factor=4)
+
+    _assert_matches_reference(features, _reference_features(data_var, 'oceanographic', 0.0, 4), 'oceanographic')
@@ -26,28 +26,13 @@ def cleanup_expired_cache(ttl_hours: Optional[int] = None) -> int:
     try:
         cache_manager = get_geojson_cache()
         
-        # Get all metadata files
-        cache_dir = cache_manager.cache_dir
-        cleaned_count = 0
-        
-        for metadata_file in cache_dir.glob("*.meta.json"):
-            try:
-                import json
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                
-                # Check if cache is expired
-                created_time = datetime.fromisoformat(metadata['created_at'])
-                ttl = timedelta(hours=ttl_hours or cache_manager.default_ttl_hours)
-                
-                if datetime.now() - created_time > ttl:
-                    cache_key = metadata.get('cache_key', metadata_file.stem.replace('.meta', ''))
-                    cache_manager._remove_cache_entry(cache_key)
-                    cleaned_count += 1
-                    logger.info(f"Cleaned up expired cache entry: {cache_key}")
-                    
-            except Exception as e:
-                logger.error(f"Error processing metadata file {metadata_file}: {e}")
+        # Take expired keys from the creation-time index (O(expired entries)), falling
+        # back to a single metadata scan until the index is built, then remove in batches
+        cutoff_date = datetime.now() - timedelta(hours=ttl_hours or cache_manager.default_ttl_hours)
+        expired_keys = cache_manager.pop_entries_created_before(cutoff_date)
+        if expired_keys is None:
+            expired_keys = [entry['cache_key'] for entry in cache_manager._scan_entries() if entry['created_at'] < cutoff_date]
+        cleaned_count = cache_manager._remove_entries(expired_keys)
         
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} expired cache entries")
@@ -71,26 +56,13 @@ def cleanup_old_cache_by_date(days_old: int = 7) -> int:
     try:
         cache_manager = get_geojson_cache()
         
+        # Take old keys from the creation-time index (O(old entries)), falling back
+        # to a single metadata scan until the index is built, then remove in batches
         cutoff_date = datetime.now() - timedelta(days=days_old)
-        cleaned_count = 0
-        
-        for metadata_file in cache_manager.cache_dir.glob("*.meta.json"):
-            try:
-                import json
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                
-                # Check if cache is older than cutoff
-                created_time = datetime.fromisoformat(metadata['created_at'])
-                
-                if created_time < cutoff_date:
-                    cache_key = metadata.get('cache_key', metadata_file.stem.replace('.meta', ''))
-                    cache_manager._remove_cache_entry(cache_key)
-                    cleaned_count += 1
-                    logger.info(f"Cleaned up old cache entry: {cache_key} (created: {created_time.isoformat()})")
-                    
-            except Exception as e:
-                logger.error(f"Error processing metadata file {metadata_file}: {e}")
+        old_keys = cache_manager.pop_entries_created_before(cutoff_date)
+        if old_keys is None:
+            old_keys = [entry['cache_key'] for entry in cache_manager._scan_entries() if entry['created_at'] < cutoff_date]
+        cleaned_count = cache_manager._remove_entries(old_keys)
         
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} old cache entries (>{days_old} days old)")
@@ -114,9 +86,8 @@ def cleanup_cache_by_size(max_size_mb: int = 500) -> int:
     try:
         cache_manager = get_geojson_cache()
         
-        # Get current cache size
-        total_size = sum(f.stat().st_size for f in cache_manager.cache_dir.glob("*") if f.is_file())
-        total_size_mb = total_size / (1024 * 1024)
+        entries = cache_manager._scan_entries()
+        total_size_mb = sum(entry['size'] for entry in entries) / (1024 * 1024)
         
         if total_size_mb <= max_size_mb:
             logger.info(f"Cache size ({total_size_mb:.1f}MB) is within limit ({max_size_mb}MB)")
@@ -124,15 +95,11 @@ def cleanup_cache_by_size(max_size_mb: int = 500) -> int:
         
         logger.info(f"Cache size ({total_size_mb:.1f}MB) exceeds limit ({max_size_mb}MB), cleaning up...")
         
-        # Use the cache manager's built-in cleanup
-        cache_manager._cleanup_oldest_entries()
+        # Evict down to 80% of the requested limit
+        cleaned_count = cache_manager._evict_to_size(entries, max_size_mb * 0.8 * 1024 * 1024)
         
-        # Count how many were actually removed
-        new_size = sum(f.stat().st_size for f in cache_manager.cache_dir.glob("*") if f.is_file())
-        removed_size_mb = (total_size - new_size) / (1024 * 1024)
-        
-        logger.info(f"Removed {removed_size_mb:.1f}MB from cache")
-        return int(removed_size_mb * 1024 / 1024)  # Approximate file count
+        logger.info(f"Removed {cleaned_count} cache entries")
+        return cleaned_count
         
     except Exception as e:
         logger.error(f"Error during size-based cache cleanup: {e}")
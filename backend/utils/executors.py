@@ -0,0 +1,46 @@
+"""
+Shared Executors
+Process-wide thread pools for running blocking work off the asyncio event loop
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Blocking network/disk I/O (NASA Earthdata downloads, NetCDF cache reads, GFW API)
+IO_MAX_WORKERS = 8
+
+# CPU-bound NumPy/xarray work (HSI calculation, statistics, GeoJSON conversion)
+COMPUTE_MAX_WORKERS = os.cpu_count() or 4
+
+_io_executor = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="poseidon-io")
+_compute_executor = ThreadPoolExecutor(max_workers=COMPUTE_MAX_WORKERS, thread_name_prefix="poseidon-compute")
+
+def get_io_executor() -> ThreadPoolExecutor:
+    """Get the shared I/O thread pool"""
+    return _io_executor
+
+async def run_io(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking I/O call on the shared I/O thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, partial(func, *args, **kwargs))
+
+def get_compute_executor() -> ThreadPoolExecutor:
+    """Get the shared compute thread pool"""
+    return _compute_executor
+
+async def run_compute(func: Callable, *args, **kwargs) -> Any:
+    """Run CPU-bound NumPy/xarray work on the shared compute thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_compute_executor, partial(func, *args, **kwargs))
+
+def shutdown_executors():
+    """Shut down the shared thread pools (called on application shutdown)"""
+    _io_executor.shutdown(wait=False, cancel_futures=True)
+    _compute_executor.shutdown(wait=False, cancel_futures=True)
+    logger.info("Shared executors shut down")
@@ -5,10 +5,13 @@ Handles file-based caching of computed GeoJSON features to avoid recomputation
 
 import json
 import os
+import orjson
 import hashlib
+import heapq
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -32,6 +35,24 @@ class GeoJSONCacheManager:
         # Cache configuration
         self.default_ttl_hours = 24  # Default cache TTL in hours
         self.max_cache_size_mb = 500  # Maximum cache size in MB
+        self.removal_batch_size = 500  # Entries removed per batch during cleanup
+        
+        # Creation-time index: min-heap of (created_at, cache_key) plus the current
+        # creation time per key (heap items that no longer match are stale and skipped).
+        # Expiry sweeps pop only the expired entries instead of scanning every file.
+        # Built by the first metadata scan after startup.
+        self._created_heap: List[Tuple[datetime, str]] = []
+        self._created_at_by_key: Dict[str, datetime] = {}
+        self._created_index_built = False
+        self._index_lock = threading.Lock()
+        
+        # Per-entry read statistics used by size-based eviction (in-process only;
+        # entries not read since startup count as last accessed at creation, 0 hits)
+        self._entry_hits: Dict[str, int] = {}
+        self._entry_last_access: Dict[str, datetime] = {}
+        
+        # Size eviction considers this fraction of least recently used entries
+        self.eviction_sample_fraction = 0.1
         
         logger.info(f"GeoJSON cache initialized at: {self.cache_dir}")
     
@@ -159,8 +180,12 @@ class GeoJSONCacheManager:
         
         try:
             cache_path = self._get_cache_file_path(cache_key)
-            with open(cache_path, 'r') as f:
-                features = json.load(f)
+            with open(cache_path, 'rb') as f:
+                features = orjson.loads(f.read())
+            
+            with self._index_lock:
+                self._entry_hits[cache_key] = self._entry_hits.get(cache_key, 0) + 1
+                self._entry_last_access[cache_key] = datetime.now()
             
             logger.info(f"Retrieved {len(features)} cached features for {cache_type} on {target_date}")
             return features
@@ -204,10 +229,12 @@ class GeoJSONCacheManager:
         try:
             # Save features
             cache_path = self._get_cache_file_path(cache_key)
-            with open(cache_path, 'w') as f:
-                json.dump(features, f, separators=(',', ':'))  # Compact JSON
+            # orjson writes compact JSON, encodes NumPy scalars and maps NaN/Inf to null
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps(features, option=orjson.OPT_SERIALIZE_NUMPY))
             
             # Save metadata
+            created_at = datetime.now()
             metadata = {
                 'cache_type': cache_type,
                 'target_date': target_date,
@@ -216,7 +243,7 @@ class GeoJSONCacheManager:
                 'threshold': threshold,
                 'density_factor': density_factor,
                 'feature_count': len(features),
-                'created_at': datetime.now().isoformat(),
+                'created_at': created_at.isoformat(),
                 'cache_key': cache_key
             }
             
@@ -226,6 +253,12 @@ class GeoJSONCacheManager:
             
             logger.info(f"Cached {len(features)} {cache_type} features for {target_date}")
             
+            # Recorded even before the index is built, so a scan running concurrently
+            # can merge in entries written after it started
+            with self._index_lock:
+                self._created_at_by_key[cache_key] = created_at
+                heapq.heappush(self._created_heap, (created_at, cache_key))
+            
             # Check cache size and cleanup if necessary
             self._cleanup_if_needed()
             
@@ -285,6 +318,10 @@ class GeoJSONCacheManager:
     
     def _remove_cache_entry(self, cache_key: str):
         """Remove a specific cache entry"""
+        self._remove_entries([cache_key])
+    
+    def _unlink_entry_files(self, cache_key: str) -> bool:
+        """Delete a cache entry's files, returning False if removal failed"""
         cache_path = self._get_cache_file_path(cache_key)
         metadata_path = self._get_metadata_file_path(cache_key)
         
@@ -293,8 +330,10 @@ class GeoJSONCacheManager:
                 cache_path.unlink()
             if metadata_path.exists():
                 metadata_path.unlink()
+            return True
         except Exception as e:
             logger.error(f"Error removing cache entry {cache_key}: {e}")
+            return False
     
     def _cleanup_if_needed(self):
         """Clean up cache if it exceeds size limits"""
@@ -304,52 +343,185 @@ class GeoJSONCacheManager:
             
             if total_size_mb > self.max_cache_size_mb:
                 logger.info(f"Cache size ({total_size_mb:.1f}MB) exceeds limit ({self.max_cache_size_mb}MB), cleaning up...")
-                self._cleanup_oldest_entries()
+                self._cleanup_to_size_limit()
                 
         except Exception as e:
             logger.error(f"Error during cache cleanup: {e}")
     
-    def _cleanup_oldest_entries(self):
-        """Remove oldest cache entries to free up space"""
-        try:
-            # Get all metadata files with their creation times
-            entries = []
-            for metadata_file in self.cache_dir.glob("*.meta.json"):
-                try:
-                    with open(metadata_file, 'r') as f:
-                        metadata = json.load(f)
-                    
-                    created_time = datetime.fromisoformat(metadata['created_at'])
-                    cache_key = metadata.get('cache_key', metadata_file.stem.replace('.meta', ''))
-                    cache_path = self._get_cache_file_path(cache_key)
-                    
-                    if cache_path.exists():
-                        entries.append((created_time, cache_key, cache_path.stat().st_size))
-                        
-                except Exception as e:
-                    logger.error(f"Error processing metadata file {metadata_file}: {e}")
+    def _scan_entries(self) -> List[Dict[str, Any]]:
+        """
+        Read every entry's metadata once
+        
+        Returns:
+            List of entries with cache_key, created_at and the on-disk size of the entry
+        """
+        entries = []
+        
+        # Scan without the index lock so cache reads and writes are not blocked by disk I/O
+        scan_started = datetime.now()
+        for metadata_file in self.cache_dir.glob("*.meta.json"):
+            try:
+                with open(metadata_file, 'r') as f:
+                    metadata = json.load(f)
+                
+                cache_key = metadata.get('cache_key', metadata_file.stem.replace('.meta', ''))
+                cache_path = self._get_cache_file_path(cache_key)
+                size = metadata_file.stat().st_size
+                if cache_path.exists():
+                    size += cache_path.stat().st_size
+                
+                entries.append({
+                    'cache_key': cache_key,
+                    'created_at': datetime.fromisoformat(metadata['created_at']),
+                    'size': size
+                })
+                
+            except Exception as e:
+                logger.error(f"Error processing metadata file {metadata_file}: {e}")
+        
+        created_at_by_key = {entry['cache_key']: entry['created_at'] for entry in entries}
+        
+        with self._index_lock:
+            # Keep entries cache_features recorded after the scan started (the scan may
+            # have missed them or read an older version)
+            for cache_key, created_at in self._created_at_by_key.items():
+                if created_at >= scan_started:
+                    created_at_by_key[cache_key] = created_at
             
-            # Sort by creation time (oldest first)
-            entries.sort(key=lambda x: x[0])
+            self._created_at_by_key = created_at_by_key
+            self._created_heap = [(created_at, cache_key) for cache_key, created_at in created_at_by_key.items()]
+            heapq.heapify(self._created_heap)
+            self._created_index_built = True
+        
+        return entries
+    
+    def pop_entries_created_before(self, cutoff: datetime) -> Optional[List[str]]:
+        """
+        Take the keys of all entries created before a cutoff from the creation-time index
+        
+        Cost is proportional to the number of matching entries, not the cache size.
+        The keys stay in the index until _remove_entries has deleted their files, and
+        entries that fail to be removed are pushed back onto the heap.
+        
+        Returns:
+            Keys to remove, or None if the index has not been built yet (caller must scan)
+        """
+        with self._index_lock:
+            if not self._created_index_built:
+                return None
             
-            # Remove oldest entries until we're under the limit
-            current_size = sum(f.stat().st_size for f in self.cache_dir.glob("*") if f.is_file())
-            target_size = self.max_cache_size_mb * 0.8 * 1024 * 1024  # 80% of limit
+            cache_keys = {}
+            while self._created_heap and self._created_heap[0][0] < cutoff:
+                created_at, cache_key = heapq.heappop(self._created_heap)
+                # Skip stale items for entries removed or rewritten since they were pushed
+                # (and duplicates left by requeued removals)
+                if self._created_at_by_key.get(cache_key) == created_at:
+                    cache_keys[cache_key] = None
             
-            removed_count = 0
-            for created_time, cache_key, size in entries:
-                if current_size <= target_size:
-                    break
-                
-                self._remove_cache_entry(cache_key)
-                current_size -= size
-                removed_count += 1
+            return list(cache_keys)
+    
+    def _remove_entries(self, cache_keys: List[str]) -> int:
+        """
+        Remove staged cache entries in fixed-size batches
+        
+        Files are deleted one by one, then the index lock is taken once per batch
+        (instead of once per entry) to drop the removed entries from the index.
+        
+        Args:
+            cache_keys: Keys selected for removal by a previous scan
+        
+        Returns:
+            Number of entries removed
+        """
+        removed_count = 0
+        for start in range(0, len(cache_keys), self.removal_batch_size):
+            batch = cache_keys[start:start + self.removal_batch_size]
+            removed = []
+            failed = []
+            for cache_key in batch:
+                (removed if self._unlink_entry_files(cache_key) else failed).append(cache_key)
+            
+            with self._index_lock:
+                for cache_key in removed:
+                    self._created_at_by_key.pop(cache_key, None)
+                    self._entry_hits.pop(cache_key, None)
+                    self._entry_last_access.pop(cache_key, None)
+                # Requeue entries still on disk so a later expiry sweep retries them
+                for cache_key in failed:
+                    created_at = self._created_at_by_key.get(cache_key)
+                    if created_at is not None:
+                        heapq.heappush(self._created_heap, (created_at, cache_key))
+            
+            removed_count += len(removed)
+        
+        return removed_count
+    
+    def _evict_to_size(self, entries: List[Dict[str, Any]], target_size_bytes: float) -> int:
+        """
+        Evict entries until the scanned entries fit in target_size_bytes (v-LRU)
+        
+        Entries are sorted by recency once. A window over the least recently used
+        fraction of them is kept in a heap on value score (hits per MB plus hit ratio),
+        and each victim is the window's lowest-scoring entry, after which the window
+        slides forward by one. A large, rarely read entry goes before a small, frequently
+        read one of similar recency.
+        
+        Args:
+            entries: Entries from _scan_entries
+            target_size_bytes: Size to shrink the cache to
+        
+        Returns:
+            Number of entries removed
+        """
+        current_size = sum(entry['size'] for entry in entries)
+        if current_size <= target_size_bytes:
+            return 0
+        
+        with self._index_lock:
+            hits = dict(self._entry_hits)
+            last_access = dict(self._entry_last_access)
+        
+        def recency(entry: Dict[str, Any]) -> datetime:
+            return last_access.get(entry['cache_key'], entry['created_at'])
+        
+        def value_score(entry: Dict[str, Any]) -> float:
+            # The v-LRU score is log(v + h + delta); log is monotonic, so compare the sum
+            entry_hits = hits.get(entry['cache_key'], 0)
+            size_mb = max(entry['size'], 1) / (1024 * 1024)
+            return entry_hits / size_mb + entry_hits / (entry_hits + 1)
+        
+        by_recency = sorted(entries, key=recency)
+        sample_size = max(1, int(len(by_recency) * self.eviction_sample_fraction))
+        
+        # (score, position, entry): the position breaks ties without comparing dicts
+        window = [(value_score(entry), position, entry) for position, entry in enumerate(by_recency[:sample_size])]
+        heapq.heapify(window)
+        next_position = sample_size
+        
+        victims = []
+        while window and current_size > target_size_bytes:
+            _, _, victim = heapq.heappop(window)
+            victims.append(victim['cache_key'])
+            current_size -= victim['size']
+            
+            if next_position < len(by_recency):
+                entry = by_recency[next_position]
+                heapq.heappush(window, (value_score(entry), next_position, entry))
+                next_position += 1
+        
+        return self._remove_entries(victims)
+    
+    def _cleanup_to_size_limit(self):
+        """Evict cache entries to free up space"""
+        try:
+            target_size = self.max_cache_size_mb * 0.8 * 1024 * 1024  # 80% of limit
+            removed_count = self._evict_to_size(self._scan_entries(), target_size)
             
             if removed_count > 0:
-                logger.info(f"Removed {removed_count} oldest cache entries")
+                logger.info(f"Evicted {removed_count} cache entries")
                 
         except Exception as e:
-            logger.error(f"Error during oldest entries cleanup: {e}")
+            logger.error(f"Error during size limit cleanup: {e}")
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -410,6 +582,11 @@ class GeoJSONCacheManager:
                     file_path.unlink()
                     removed_count += 1
             
+            with self._index_lock:
+                self._created_heap = []
+                self._created_at_by_key = {}
+                self._created_index_built = True
+            
             logger.info(f"Cleared {removed_count} cache files")
             return removed_count
             
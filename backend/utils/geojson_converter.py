@@ -3,17 +3,60 @@ GeoJSON Converter for HSI Data
 Converts HSI grid data to GeoJSON format for map visualization
 """
 
+import threading
+from collections import OrderedDict
 import numpy as np
+import orjson
 import xarray as xr
 from models.hsi_model import HSIModel
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
 from .geojson_cache import get_geojson_cache
 logger = logging.getLogger(__name__)
 
+# In-process memo of encoded HSI features keyed on the HSI content hash
+_FEATURES_MEMO_MAX_ENTRIES = 8
+_features_memo: "OrderedDict[Tuple, bytes]" = OrderedDict()
+_features_memo_lock = threading.Lock()
 
-def convert_hsi_to_geojson_cached(hsi_data: xr.Dataset, target_date: str, shark_species: str, threshold: float = 0.5) -> List[Dict[str, Any]]:
+# Decimal places kept for dataset cell coordinates (1e-6 degrees is ~11 cm)
+_COORDINATE_DECIMALS = 6
+
+def _round_coordinates(values: np.ndarray) -> np.ndarray:
+    """Round coordinates to _COORDINATE_DECIMALS as float64 (float32 values would not print short)"""
+    return np.round(np.asarray(values, dtype=np.float64), _COORDINATE_DECIMALS)
+
+
+def _get_memoized_encoded(memo_key: Tuple) -> Optional[bytes]:
+    """Get memoized encoded features for a content-hash key"""
+    with _features_memo_lock:
+        encoded = _features_memo.get(memo_key)
+        if encoded is None:
+            return None
+        _features_memo.move_to_end(memo_key)
+    return encoded
+
+def _memoize_features(memo_key: Optional[Tuple], features: List[Dict[str, Any]]) -> bytes:
+    """Encode features with orjson and store them (much smaller than the Python object tree)"""
+    encoded = orjson.dumps(features, option=orjson.OPT_SERIALIZE_NUMPY)
+    if memo_key is None:
+        return encoded
+    with _features_memo_lock:
+        _features_memo[memo_key] = encoded
+        _features_memo.move_to_end(memo_key)
+        while len(_features_memo) > _FEATURES_MEMO_MAX_ENTRIES:
+            _features_memo.popitem(last=False)
+    return encoded
+
+def _hsi_memo_key(hsi_data: xr.Dataset, shark_species: str, threshold: float) -> Optional[Tuple]:
+    """Build the memo key from the HSI content hash (None if the grid was not hashed)"""
+    content_hash = hsi_data.attrs.get('content_hash')
+    return (content_hash, shark_species, threshold) if content_hash else None
+
+
+def convert_hsi_to_geojson_cached(hsi_data: xr.Dataset, target_date: str, shark_species: str, threshold: float = 0.5,
+                                  hsi_model: Optional[HSIModel] = None) -> List[Dict[str, Any]]:
     """
     Convert HSI data to GeoJSON format with caching support
     
@@ -22,10 +65,53 @@ def convert_hsi_to_geojson_cached(hsi_data: xr.Dataset, target_date: str, shark_
         target_date: Target date for caching
         shark_species: Shark species for caching
         threshold: Minimum HSI value to include in output
+        hsi_model: Model whose shark profiles drive component contributions (the caller's instance)
     
     Returns:
         List of GeoJSON features
     """
+    # Try the in-process memo first (keyed on the computed grid, not just the request)
+    memo_key = _hsi_memo_key(hsi_data, shark_species, threshold)
+    if memo_key is not None:
+        encoded = _get_memoized_encoded(memo_key)
+        if encoded is not None:
+            logger.info(f"Using memoized HSI GeoJSON features for {shark_species} on {target_date}")
+            return orjson.loads(encoded)
+    
+    features = _load_or_generate_hsi_features(hsi_data, target_date, shark_species, threshold, hsi_model)
+    _memoize_features(memo_key, features)
+    return features
+
+def convert_hsi_to_geojson_encoded(hsi_data: xr.Dataset, target_date: str, shark_species: str, threshold: float = 0.5,
+                                   hsi_model: Optional[HSIModel] = None) -> bytes:
+    """
+    Convert HSI data to an orjson-encoded GeoJSON features array with caching support
+    
+    Memo hits return the stored bytes directly, without building the feature objects.
+    
+    Args:
+        hsi_data: HSI dataset with lat, lon, and hsi values
+        target_date: Target date for caching
+        shark_species: Shark species for caching
+        threshold: Minimum HSI value to include in output
+        hsi_model: Model whose shark profiles drive component contributions (the caller's instance)
+    
+    Returns:
+        JSON-encoded list of GeoJSON features
+    """
+    memo_key = _hsi_memo_key(hsi_data, shark_species, threshold)
+    if memo_key is not None:
+        encoded = _get_memoized_encoded(memo_key)
+        if encoded is not None:
+            logger.info(f"Using memoized HSI GeoJSON features for {shark_species} on {target_date}")
+            return encoded
+    
+    features = _load_or_generate_hsi_features(hsi_data, target_date, shark_species, threshold, hsi_model)
+    return _memoize_features(memo_key, features)
+
+def _load_or_generate_hsi_features(hsi_data: xr.Dataset, target_date: str, shark_species: str, threshold: float,
+                                   hsi_model: Optional[HSIModel] = None) -> List[Dict[str, Any]]:
+    """Get HSI features from the disk cache, generating and caching them on a miss"""
     cache_manager = get_geojson_cache()
     
     # Try to get from cache first
@@ -54,7 +140,7 @@ def convert_hsi_to_geojson_cached(hsi_data: xr.Dataset, target_date: str, shark_
         else:
             logger.warning("No valid HSI values found (all NaN)")
     
-    features = convert_hsi_to_geojson(hsi_data, threshold, shark_species)
+    features = convert_hsi_to_geojson(hsi_data, threshold, shark_species, hsi_model)
     logger.info(f"Converted to {len(features)} GeoJSON features")
     
     # Cache the results
@@ -68,7 +154,8 @@ def convert_hsi_to_geojson_cached(hsi_data: xr.Dataset, target_date: str, shark_
     
     return features
 
-def convert_hsi_to_geojson(hsi_data: xr.Dataset, threshold: float = 0.5, shark_species: str = None) -> List[Dict[str, Any]]:
+def convert_hsi_to_geojson(hsi_data: xr.Dataset, threshold: float = 0.5, shark_species: str = None,
+                           hsi_model: Optional[HSIModel] = None) -> List[Dict[str, Any]]:
     """
     Convert HSI data to GeoJSON format for map visualization (OPTIMIZED)
 
@@ -76,6 +163,7 @@ def convert_hsi_to_geojson(hsi_data: xr.Dataset, threshold: float = 0.5, shark_s
         hsi_data: HSI dataset with lat, lon, and hsi values
         threshold: Minimum HSI value to include in output
         shark_species: Shark species for component contribution calculation
+        hsi_model: Model providing the shark profile (a new HSIModel if None)
 
     Returns:
         List of GeoJSON features
@@ -110,91 +198,76 @@ def convert_hsi_to_geojson(hsi_data: xr.Dataset, threshold: float = 0.5, shark_s
                     arr = np.squeeze(arr)
                 var_arrays[var_name] = arr
         
+        if hsi_arr.ndim != 2:
+            logger.error(f"Invalid HSI array shape: {hsi_arr.shape}. Expected 2D (lat, lon) array.")
+            return []
+        
         # Pre-filter valid cells using vectorized operations (MAJOR SPEEDUP)
+        # The last row/column is skipped since polygons are built from the grid step
         valid_mask = ~np.isnan(hsi_arr) & (hsi_arr >= threshold)
-        valid_indices = np.argwhere(valid_mask)
+        valid_mask[len(lats) - 1:, :] = False
+        valid_mask[:, len(lons) - 1:] = False
+        rows, cols = np.nonzero(valid_mask)
         
-        logger.info(f"Processing {len(valid_indices)} valid cells (filtered from {hsi_arr.size} total)")
+        logger.info(f"Processing {len(rows)} valid cells (filtered from {hsi_arr.size} total)")
         
-        # Validate dimensions
-        if len(valid_indices) > 0 and valid_indices.shape[1] != 2:
-            logger.error(f"Invalid valid_indices shape: {valid_indices.shape}. Expected (N, 2) for 2D array.")
-            logger.error(f"HSI array shape: {hsi_arr.shape}, ndim: {hsi_arr.ndim}")
-            return []
+        # Build every column as a flat array and convert to Python floats once
+        # (column-wise .tolist() instead of per-cell float() calls)
+        cell_lats = lats[rows]
+        cell_lons = lons[cols]
+        half_lat_step = lat_step / 2
+        half_lon_step = lon_step / 2
+        west = (cell_lons - half_lon_step).tolist()
+        east = (cell_lons + half_lon_step).tolist()
+        south = (cell_lats - half_lat_step).tolist()
+        north = (cell_lats + half_lat_step).tolist()
+        hsi_values = hsi_arr[rows, cols].tolist()
+        lat_values = cell_lats.tolist()
+        lon_values = cell_lons.tolist()
+        
+        property_columns = []
+        for var_name, arr in var_arrays.items():
+            values = arr[rows, cols]
+            property_columns.append((var_name, np.where(np.isnan(values), 0.0, values).tolist()))
         
-        # Initialize HSIModel once (not per cell!)
-        hsi_model = None
-        profile = None
+        # Calculate component contributions for all cells in one batch (enhanced model only)
+        contributions = [None] * len(rows)
         if shark_species and 'i_phys' in var_arrays:
-            hsi_model = HSIModel()
+            if hsi_model is None:
+                hsi_model = HSIModel()
             profile = hsi_model.shark_profiles.get(shark_species)
+            if profile:
+                try:
+                    components = [var_arrays[name][rows, cols] for name in ('i_phys', 'i_prey', 'i_topo', 'i_anthro')]
+                    complete = ~np.any(np.isnan(np.stack(components)), axis=0)
+                    complete_indices = np.flatnonzero(complete).tolist()
+                    batch = hsi_model.calculate_component_contributions_batch(
+                        *(component[complete] for component in components), profile
+                    )
+                    for index, cell_contributions in zip(complete_indices, batch):
+                        contributions[index] = cell_contributions
+                except Exception as e:
+                    logger.warning(f"Component contribution calculation failed: {e}")
         
-        # Build features using list comprehension (faster than append loop)
         features = []
-        for idx in valid_indices:
-            try:
-                i, j = idx
-            except ValueError as e:
-                logger.error(f"Failed to unpack index {idx}: {e}")
-                logger.error(f"valid_indices shape: {valid_indices.shape}")
-                continue
-            
-            # Skip if out of bounds for grid creation
-            if i >= len(lats) - 1 or j >= len(lons) - 1:
-                continue
-            
-            lat = lats[i]
-            lon = lons[j]
-            hsi_value = float(hsi_arr[i, j])
-            
-            # Grid coordinates represent cell centers, so create polygon centered on that point
-            # by extending half a step in each direction
-            half_lat_step = lat_step / 2
-            half_lon_step = lon_step / 2
-            
-            coordinates = [[
-                [lon - half_lon_step, lat - half_lat_step],
-                [lon + half_lon_step, lat - half_lat_step],
-                [lon + half_lon_step, lat + half_lat_step],
-                [lon - half_lon_step, lat + half_lat_step],
-                [lon - half_lon_step, lat - half_lat_step]
-            ]]
-            
-            # Build properties dict efficiently
-            # Center coordinates are already at the grid point
+        for k in range(len(rows)):
+            # Grid coordinates represent cell centers, so the polygon extends half a step in each direction
+            x0, x1, y0, y1 = west[k], east[k], south[k], north[k]
             properties = {
-                "hsi": hsi_value,
-                "lat": float(lat),
-                "lon": float(lon)
+                "hsi": hsi_values[k],
+                "lat": lat_values[k],
+                "lon": lon_values[k]
             }
+            for var_name, values in property_columns:
+                properties[var_name] = values[k]
+            if contributions[k] is not None:
+                properties["component_contributions"] = contributions[k]
             
-            # Add all available suitability values (vectorized access)
-            for var_name, arr in var_arrays.items():
-                val = arr[i, j]
-                properties[var_name] = float(val) if not np.isnan(val) else 0.0
-            
-            # Calculate component contributions (only if enhanced model and valid)
-            if profile and 'i_phys' in var_arrays:
-                try:
-                    i_phys = float(var_arrays['i_phys'][i, j])
-                    i_prey = float(var_arrays['i_prey'][i, j])
-                    i_topo = float(var_arrays['i_topo'][i, j])
-                    i_anthro = float(var_arrays['i_anthro'][i, j])
-                    
-                    if not (np.isnan(i_phys) or np.isnan(i_prey) or np.isnan(i_topo) or np.isnan(i_anthro)):
-                        contributions = hsi_model.calculate_component_contributions(
-                            i_phys, i_prey, i_topo, i_anthro, profile
-                        )
-                        properties["component_contributions"] = contributions
-                except Exception as e:
-                    pass  # Skip contribution calculation on error
-            
-            # Create feature
             features.append({
                 "type": "Feature",
                 "geometry": {
                     "type": "Polygon",
-                    "coordinates": coordinates
+                    "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]
                 },
                 "properties": properties
             })
@@ -252,6 +325,56 @@ def convert_dataset_to_geojson_cached(dataset: xr.Dataset, variable: str, target
     
     return features
 
+def _output_variable_name(variable: str) -> str:
+    """Name under which a requested variable's values are returned (the oceanographic overlay reads sea_level)"""
+    return 'oceanographic' if variable == 'oceanographic' else variable
+
+def _sample_dataset_cells(dataset: xr.Dataset, variable: str, threshold: float, density_factor: int) -> Tuple[str, Dict[str, np.ndarray]]:
+    """
+    Sample every density_factor-th grid cell of a dataset variable and keep those at or above threshold
+    
+    Returns:
+        Tuple of (output variable name, dict of 'values', 'south', 'north', 'west', 'east' cell arrays)
+    """
+    # Handle special case for oceanographic overlay
+    output_variable = _output_variable_name(variable)
+    if variable == 'oceanographic':
+        # For oceanographic overlay, use sea_level data but name it oceanographic
+        data_var = dataset['sea_level']
+    else:
+        data_var = dataset[variable]
+        
+    lats = data_var.lat.values
+    lons = data_var.lon.values
+    
+    # Sample every density_factor-th row/column (the last row/column is skipped since
+    # polygons are built from the grid step) and filter the sampled grid in one pass
+    row_idx = np.arange(0, len(lats) - 1, density_factor)
+    col_idx = np.arange(0, len(lons) - 1, density_factor)
+    # Drop singleton non-spatial dims (e.g. the length-1 time axis kept by interp)
+    extra_dims = [dim for dim in data_var.dims if dim not in ('lat', 'lon')]
+    spatial_var = data_var.squeeze(extra_dims, drop=True).transpose('lat', 'lon')
+    sampled = np.asarray(spatial_var.values)[np.ix_(row_idx, col_idx)]
+    valid_mask = ~np.isnan(sampled) & (sampled >= threshold)
+    rows, cols = np.nonzero(valid_mask)
+    
+    cell_rows = row_idx[rows]
+    cell_cols = col_idx[cols]
+    south = lats[cell_rows]
+    west = lons[cell_cols]
+    north = south + (lats[cell_rows + 1] - south) * density_factor
+    east = west + (lons[cell_cols + 1] - west) * density_factor
+    
+    # Round cell edges to _COORDINATE_DECIMALS (~11 cm, far below the grid resolution)
+    # so they serialize as short decimal strings instead of full-precision doubles
+    return output_variable, {
+        'values': sampled[rows, cols],
+        'south': _round_coordinates(south),
+        'north': _round_coordinates(north),
+        'west': _round_coordinates(west),
+        'east': _round_coordinates(east)
+    }
+
 def convert_dataset_to_geojson(dataset: xr.Dataset, variable: str, threshold: float = 0.0, density_factor: int = 4) -> List[Dict[str, Any]]:
     """
     Convert raw dataset to GeoJSON format for overlay visualization
@@ -266,74 +389,30 @@ def convert_dataset_to_geojson(dataset: xr.Dataset, variable: str, threshold: fl
         List of GeoJSON features
     """
     try:
-        features = []
+        output_variable, cells = _sample_dataset_cells(dataset, variable, threshold, density_factor)
         
-        # Extract coordinates and variable values
-        # Handle special case for oceanographic overlay
-        if variable == 'oceanographic':
-            # For oceanographic overlay, use sea_level data but name it oceanographic
-            data_var = dataset['sea_level']
-            output_variable = 'oceanographic'
-        else:
-            data_var = dataset[variable]
-            output_variable = variable
-            
-        lats = data_var.lat.values
-        lons = data_var.lon.values
+        # Convert every column to Python floats once
+        values = cells['values'].tolist()
+        center_lats = _round_coordinates((cells['south'] + cells['north']) / 2).tolist()
+        center_lons = _round_coordinates((cells['west'] + cells['east']) / 2).tolist()
+        south, north = cells['south'].tolist(), cells['north'].tolist()
+        west, east = cells['west'].tolist(), cells['east'].tolist()
         
-        # Create grid cells as polygons with reduced density
-        for i, lat in enumerate(lats[:-1]):
-            # Skip rows based on density factor
-            if i % density_factor != 0:
-                continue
-                
-            for j, lon in enumerate(lons[:-1]):
-                # Skip columns based on density factor
-                if j % density_factor != 0:
-                    continue
-                
-                value_raw = data_var.isel(lat=i, lon=j).values
-                
-                # Skip NaN values
-                if np.isnan(value_raw):
-                    continue
-                
-                value = float(value_raw)
-                
-                # Only include cells above threshold
-                if value >= threshold:
-                    # Create polygon coordinates with larger step size
-                    lat_step = (lats[i+1] - lat) * density_factor
-                    lon_step = (lons[j+1] - lon) * density_factor
-                    
-                    coordinates = [
-                        [
-                            [lon, lat],
-                            [lon + lon_step, lat],
-                            [lon + lon_step, lat + lat_step],
-                            [lon, lat + lat_step],
-                            [lon, lat]
-                        ]
-                    ]
-                    
-                    # Create properties
-                    properties = {
-                        output_variable: value,
-                        "lat": float(lat + lat_step/2),
-                        "lon": float(lon + lon_step/2)
-                    }
-                    
-                    # Create feature
-                    feature = {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "Polygon",
-                            "coordinates": coordinates
-                        },
-                        "properties": properties
-                    }
-                    
-                    features.append(feature)
+        features = []
+        for k in range(len(values)):
+            x0, x1, y0, y1 = west[k], east[k], south[k], north[k]
+            features.append({
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]]
+                },
+                "properties": {
+                    output_variable: values[k],
+                    "lat": center_lats[k],
+                    "lon": center_lons[k]
+                }
+            })
         
         logger.info(f"Converted {variable} data to {len(features)} GeoJSON features (density factor: {density_factor})")
         return features
@@ -342,6 +421,41 @@ def convert_dataset_to_geojson(dataset: xr.Dataset, variable: str, threshold: fl
         logger.error(f"GeoJSON conversion failed for {variable}: {e}")
         return []
 
+def convert_dataset_to_flat(dataset: xr.Dataset, variable: str, threshold: float = 0.0, density_factor: int = 4) -> Dict[str, Any]:
+    """
+    Convert raw dataset to column-major ("flat") arrays instead of GeoJSON features
+    
+    Selects the same cells as convert_dataset_to_geojson, but returns parallel NumPy
+    arrays of cell-center coordinates and values (serialized with OPT_SERIALIZE_NUMPY).
+    Cell k spans lon[k] ± cell_width/2 and lat[k] ± cell_height/2.
+    
+    Args:
+        dataset: Raw dataset with lat, lon, and variable values
+        variable: Variable name to extract (e.g., 'sea_level')
+        threshold: Minimum value to include in output (default 0.0 for all data)
+        density_factor: Factor to reduce density (every Nth point, default 4)
+    
+    Returns:
+        Dict with 'lon', 'lat', the variable's values, 'cell_width' and 'cell_height' arrays
+    """
+    # Resolved up front so the error fallback uses the same key as the success path
+    output_variable = _output_variable_name(variable)
+    try:
+        _, cells = _sample_dataset_cells(dataset, variable, threshold, density_factor)
+        flat = {
+            "lon": _round_coordinates((cells['west'] + cells['east']) / 2),
+            "lat": _round_coordinates((cells['south'] + cells['north']) / 2),
+            output_variable: cells['values'],
+            "cell_width": _round_coordinates(cells['east'] - cells['west']),
+            "cell_height": _round_coordinates(cells['north'] - cells['south'])
+        }
+        logger.info(f"Converted {variable} data to {len(cells['values'])} flat cells (density factor: {density_factor})")
+        return flat
+        
+    except Exception as e:
+        logger.error(f"Flat conversion failed for {variable}: {e}")
+        return {"lon": [], "lat": [], output_variable: [], "cell_width": [], "cell_height": []}
+
 def convert_hsi_to_heatmap_data_cached(hsi_data: xr.Dataset, target_date: str, shark_species: str, max_points: int = 10000) -> List[Dict[str, Any]]:
     """
     Convert HSI data to heatmap format with caching support
@@ -0,0 +1,183 @@
+"""
+Response Cache Manager
+Handles in-memory caching of serialized API responses so identical requests skip recomputation
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ResponseCacheManager:
+    """Manages in-memory LRU caching of encoded response bodies"""
+
+    def __init__(self, max_entries: int = 64, max_size_mb: int = 512):
+        """
+        Initialize the response cache
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_size_mb: Maximum total size of cached bodies in MB
+        """
+        self.max_entries = max_entries
+        self.max_size_bytes = max_size_mb * 1024 * 1024
+
+        # Cache configuration
+        self.past_date_ttl_seconds = 86400  # Responses for past dates are immutable
+        self.default_ttl_seconds = 3600  # Today's data may still be updated upstream
+
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def build_key(self, namespace: str, **params) -> str:
+        """
+        Build a deterministic cache key from the namespace and sorted parameters
+
+        Args:
+            namespace: Endpoint namespace (e.g. 'hotspots')
+            **params: Request parameters that affect the response body
+
+        Returns:
+            Cache key string
+        """
+        parts = [namespace] + [f"{name}={params[name]}" for name in sorted(params)]
+        return "|".join(parts)
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str, Optional[str]]]:
+        """
+        Get a cached response body
+
+        Returns:
+            Tuple of (body, media_type, content_encoding) or None if not cached or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            if entry['expires_at'] < time.monotonic():
+                self._remove_entry(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry['body'], entry['media_type'], entry['content_encoding']
+
+    def set(self,
+            key: str,
+            body: bytes,
+            media_type: str,
+            ttl_seconds: Optional[int] = None,
+            namespace: Optional[str] = None,
+            params: Optional[Dict[str, Any]] = None,
+            content_encoding: Optional[str] = None):
+        """
+        Store an encoded response body
+
+        Args:
+            key: Cache key from build_key
+            body: Already-encoded response body
+            media_type: Response Content-Type
+            ttl_seconds: Entry lifetime (default: default_ttl_seconds)
+            namespace: Endpoint namespace, used for invalidation
+            params: Request parameters, used for invalidation
+            content_encoding: Content-Encoding of the stored body (e.g. 'gzip'), None if uncompressed
+        """
+        size = len(body)
+        if size > self.max_size_bytes:
+            logger.warning(f"Response for {key} too large to cache ({size / 1024 / 1024:.1f} MB)")
+            return
+
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+
+        with self._lock:
+            if key in self._entries:
+                self._remove_entry(key)
+
+            self._entries[key] = {
+                'body': body,
+                'media_type': media_type,
+                'content_encoding': content_encoding,
+                'size': size,
+                'expires_at': time.monotonic() + ttl,
+                'namespace': namespace,
+                'params': params or {}
+            }
+            self._size_bytes += size
+
+            # Evict least recently used entries until within limits
+            while self._entries and (len(self._entries) > self.max_entries or self._size_bytes > self.max_size_bytes):
+                oldest_key = next(iter(self._entries))
+                self._remove_entry(oldest_key)
+
+        logger.info(f"Cached response for {key} ({size / 1024:.1f} KB)")
+
+    def _remove_entry(self, key: str):
+        """Remove an entry (caller must hold the lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry['size']
+
+    def invalidate(self, namespace: Optional[str] = None, **filters) -> int:
+        """
+        Invalidate cached responses matching the given namespace and parameter filters
+
+        Args:
+            namespace: Endpoint namespace (None matches all)
+            **filters: Parameter values to match (None values are ignored)
+
+        Returns:
+            Number of invalidated entries
+        """
+        filters = {name: value for name, value in filters.items() if value is not None}
+
+        with self._lock:
+            matching_keys = [
+                key for key, entry in self._entries.items()
+                if (namespace is None or entry['namespace'] == namespace)
+                and all(entry['params'].get(name) == value for name, value in filters.items())
+            ]
+            for key in matching_keys:
+                self._remove_entry(key)
+
+        if matching_keys:
+            logger.info(f"Invalidated {len(matching_keys)} cached responses")
+        return len(matching_keys)
+
+    def clear(self) -> int:
+        """Clear all cached responses"""
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self._size_bytes = 0
+        return count
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache statistics"""
+        with self._lock:
+            total_requests = self._hits + self._misses
+            return {
+                'total_entries': len(self._entries),
+                'total_size_mb': round(self._size_bytes / 1024 / 1024, 2),
+                'max_entries': self.max_entries,
+                'max_size_mb': round(self.max_size_bytes / 1024 / 1024, 2),
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': round(self._hits / total_requests, 3) if total_requests else 0.0
+            }
+
+
+# Global response cache instance
+_response_cache = ResponseCacheManager()
+
+def get_response_cache() -> ResponseCacheManager:
+    """Get the global response cache instance"""
+    return _response_cache